@@ -11,6 +11,7 @@ from app.exceptions.handlers import setup_exception_handlers
 from app.middleware.localization_middleware import LocalizationMiddleware
 from app.middleware.translation_manager import _
 from app.modules import route as api_routers
+from app.modules.cv_extraction.repositories.cv_repo import CVRepository, shutdown_pdf_pool
 
 
 def custom_openapi(app: FastAPI):
@@ -87,6 +88,10 @@ def create_app():
     # Custom exception handlers
     setup_exception_handlers(app)
 
+    # Release pooled outbound connections and PDF worker processes on shutdown
+    app.add_event_handler('shutdown', CVRepository.close_session)
+    app.add_event_handler('shutdown', shutdown_pdf_pool)
+
     # Optional root endpoint with version info
     @app.get("/", tags=["Root"])
     async def root():
@@ -66,6 +66,7 @@ class PagingInfo(BaseModel):
 	total_pages: int | None = Body(default=0, description='Tổng số trang', examples=[10])
 	page: int | None = Body(default=0, description='Trang hiện tại', examples=[1])
 	page_size: int | None = Body(default=0, description='Số lượng dữ liệu mỗi trang', examples=[10])
+	next_cursor: str | None = Body(default=None, description='Con trỏ để lấy trang tiếp theo', examples=[None])
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -124,6 +125,7 @@ class FilterableRequestSchema(RequestSchema):
 
 	page: int | None = Field(default=1, ge=1, description='Page number')
 	page_size: int | None = Field(default=10, ge=1, description='Number of items per page')
+	cursor: str | None = Field(default=None, description='Keyset cursor from a previous page; takes precedence over page')
 	filters: List[Filter] | None = Field(default=[], description='List of dynamic filters')
 
 	def model_dump(self, **kwargs):
@@ -140,12 +142,15 @@ class Pagination(BaseModel, Generic[T]):
 	model_config = ConfigDict(arbitrary_types_allowed=True)
 
 	items: List[T]
-	total_count: int
+	total_count: int | None
 	page: int
 	page_size: int
+	next_cursor: str | None = None
 
 	@property
-	def total_pages(self) -> int:
+	def total_pages(self) -> int | None:
+		if self.total_count is None:
+			return None
 		return (self.total_count + self.page_size - 1) // self.page_size
 
 	@property
@@ -154,4 +159,6 @@ class Pagination(BaseModel, Generic[T]):
 
 	@property
 	def has_next(self) -> bool:
+		if self.total_count is None:
+			return self.next_cursor is not None
 		return self.page < self.total_pages
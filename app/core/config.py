@@ -1,6 +1,7 @@
 import json
 import os
 from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv  # type: ignore
 from pydantic import BaseModel
@@ -29,6 +30,14 @@ SERVICE = 'gemini'
 MODEL_NAME = 'model/gemini-2.0-flash'
 
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
+# Optional comma-separated pool of keys; CV analyses are spread over them round-robin to raise the rate-limit ceiling
+GOOGLE_API_KEYS = [key.strip() for key in os.getenv('GOOGLE_API_KEYS', '').split(',') if key.strip()] or [GOOGLE_API_KEY]
+
+# CV extraction models; simple list-style sections go to the lighter model
+CV_EXTRACTION_MODEL = os.getenv('CV_EXTRACTION_MODEL', 'gemini-2.0-flash')
+CV_LIGHT_EXTRACTION_MODEL = os.getenv('CV_LIGHT_EXTRACTION_MODEL', 'gemini-2.0-flash-lite')
+# Extract sections, keywords and summary in one LLM call; the per-step branches remain as fallback
+CV_FUSED_EXTRACTION = os.getenv('CV_FUSED_EXTRACTION', 'true').lower() == 'true'
 
 # # Google OAuth Settings
 # CLIENT_SECRET_FILE = os.path.join(os.path.dirname(__file__), 'client-secret.json')
@@ -61,10 +70,16 @@ MINIO_ACCESS_KEY = os.getenv('MINIO_ACCESS_KEY', 'minioadmin')
 MINIO_SECRET_KEY = os.getenv('MINIO_SECRET_KEY', 'minioadmin')
 MINIO_BUCKET_NAME = os.getenv('MINIO_BUCKET_NAME', 'cgsem')
 MINIO_SECURE = False  # Using boolean instead of string
+MINIO_POOL_MAXSIZE = int(os.getenv('MINIO_POOL_MAXSIZE', '64'))
 
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/0')
 
+# Redis cache of CV extraction results; entries hold candidate PII, so it is off unless a URL is configured
+CV_EXTRACTION_CACHE_URL = os.getenv('CV_EXTRACTION_CACHE_URL') or None
+# Connect/read timeout in seconds, so an unreachable cache degrades to a miss quickly
+CV_EXTRACTION_CACHE_TIMEOUT = float(os.getenv('CV_EXTRACTION_CACHE_TIMEOUT', '0.5'))
+
 
 CONTEXT_PRICE_PER_MILLION = 0.0004
 INPUT_PRICE_PER_MILLION = 0.0004
@@ -95,8 +110,11 @@ class Settings(BaseModel):
 	MINIO_SECRET_KEY: str = MINIO_SECRET_KEY
 	MINIO_BUCKET_NAME: str = MINIO_BUCKET_NAME
 	MINIO_SECURE: bool = MINIO_SECURE
+	MINIO_POOL_MAXSIZE: int = MINIO_POOL_MAXSIZE
 	CELERY_BROKER_URL: str = CELERY_BROKER_URL
 	CELERY_RESULT_BACKEND: str = CELERY_RESULT_BACKEND
+	CV_EXTRACTION_CACHE_URL: Optional[str] = CV_EXTRACTION_CACHE_URL
+	CV_EXTRACTION_CACHE_TIMEOUT: float = CV_EXTRACTION_CACHE_TIMEOUT
 
 
 
@@ -1,8 +1,10 @@
-from app.core.config import GOOGLE_API_KEY
+from app.core.config import GOOGLE_API_KEYS
 from .cv_processor import CVProcessorWorkflow
 from app.modules.cv_extraction.repositories.cv_agent.agent_schema import CVAnalysisResult
+import asyncio
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
 class CVAnalyzer:
     """
@@ -11,7 +13,7 @@ class CVAnalyzer:
     """
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.cv_processor = CVProcessorWorkflow(api_key=GOOGLE_API_KEY)
+        self.cv_processor = CVProcessorWorkflow(api_key=GOOGLE_API_KEYS)
 
     async def analyze_cv_content(self, cv_content: str, job_description: Optional[str] = None) -> Optional[CVAnalysisResult]:
         """
@@ -29,3 +31,42 @@ class CVAnalyzer:
         except Exception as e:
             self.logger.exception(f'Error in CVAnalyzer.analyze_cv_content: {str(e)}')
             return None
+
+    async def analyze_cv_batch(
+        self,
+        cv_contents: List[str],
+        job_description: Optional[str] = None,
+        batch_size: int = 5,
+        delay_ms: int = 0,
+    ) -> List[Optional[CVAnalysisResult]]:
+        """
+        Analyze several CVs concurrently, at most batch_size at a time.
+
+        Args:
+            cv_contents: CV texts to analyze
+            job_description: Optional job description applied to every CV
+            batch_size: Maximum number of CVs analyzed at once
+            delay_ms: Pause after each CV before its slot is released, to spread provider load
+
+        Returns:
+            One CVAnalysisResult (or None on error) per input, in input order
+        """
+        semaphore = asyncio.Semaphore(batch_size)
+
+        async def analyze_one(cv_content: str) -> Optional[CVAnalysisResult]:
+            async with semaphore:
+                result = await self.analyze_cv_content(cv_content, job_description)
+                if delay_ms:
+                    await asyncio.sleep(delay_ms / 1000)
+                return result
+
+        return await asyncio.gather(*(analyze_one(cv_content) for cv_content in cv_contents))
+
+
+@lru_cache(maxsize=None)
+def get_cv_analyzer() -> CVAnalyzer:
+    """
+    Return the process-wide CVAnalyzer, building its compiled workflow on first use.
+    Per-run data lives in the graph state and context variables, so concurrent requests can share it.
+    """
+    return CVAnalyzer()
@@ -1,6 +1,9 @@
+import operator
 from typing import Annotated, Dict, List, Optional, TypedDict, Literal
-from langgraph.graph.message import add_messages
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Extracted items are written once by the LLM parser and only read afterwards
+_ITEM_CONFIG = ConfigDict(extra='ignore', frozen=True)
 
 # --- LLM Chunking Models ---
 
@@ -8,6 +11,8 @@ from pydantic import BaseModel, Field
 class CVChunkWithSection(BaseModel):
 	"""A chunk of CV content with its classified section type."""
 
+	model_config = _ITEM_CONFIG
+
 	chunk_content: str = Field(description='The actual text content of this chunk')
 	section: Literal[
 		'personal_info',
@@ -24,6 +29,8 @@ class CVChunkWithSection(BaseModel):
 class LLMChunkingResult(BaseModel):
 	"""Result of LLM-based intelligent chunking and classification."""
 
+	model_config = _ITEM_CONFIG
+
 	chunks: List[CVChunkWithSection] = Field(description='List of intelligently chunked and classified CV sections')
 
 
@@ -33,6 +40,8 @@ class LLMChunkingResult(BaseModel):
 class PersonalInfoItem(BaseModel):
 	"""Represents extracted personal information from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	full_name: Optional[str] = Field(None, description='Full name of the candidate.')
 	email: Optional[str] = Field(None, description='Email address.')
 	phone_number: Optional[str] = Field(None, description='Contact phone number.')
@@ -50,6 +59,8 @@ class PersonalInfoItem(BaseModel):
 class EducationItem(BaseModel):
 	"""Represents an educational qualification extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	institution_name: str = Field(..., description='Name of the educational institution.')
 	degree_name: Optional[str] = Field(None, description='Degree obtained (e.g., Bachelor of Science, Master of Arts).')
 	major: Optional[str] = Field(None, description='Major or field of study.')
@@ -69,12 +80,16 @@ class EducationItem(BaseModel):
 
 
 class ListEducationItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[EducationItem] = Field(default_factory=list)
 
 
 class WorkExperienceItem(BaseModel):
 	"""Represents a work experience entry extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	company_name: str = Field(..., description='Name of the company or organization.')
 	job_title: str = Field(..., description='Position or job title held.')
 	start_date: Optional[str] = Field(None, description='Start date of employment (e.g., YYYY-MM).')
@@ -89,12 +104,16 @@ class WorkExperienceItem(BaseModel):
 
 
 class ListWorkExperienceItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[WorkExperienceItem] = Field(default_factory=list)
 
 
 class SkillItem(BaseModel):
 	"""Represents a skill extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	skill_name: str = Field(..., description='Name of the skill (e.g., Python, Project Management).')
 	proficiency_level: Optional[str] = Field(
 		None,
@@ -108,12 +127,16 @@ class SkillItem(BaseModel):
 
 
 class ListSkillItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[SkillItem] = Field(default_factory=list)
 
 
 class ProjectItem(BaseModel):
 	"""Represents a project extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	project_name: str = Field(..., description='Name or title of the project.')
 	description: Optional[str] = Field(
 		None,
@@ -133,12 +156,16 @@ class ProjectItem(BaseModel):
 
 
 class ListProjectItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[ProjectItem] = Field(default_factory=list)
 
 
 class CertificateItem(BaseModel):
 	"""Represents a certification or course extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	certificate_name: str = Field(..., description='Name of the certificate or course.')
 	issuing_organization: Optional[str] = Field(None, description='Organization that issued the certificate.')
 	issue_date: Optional[str] = Field(None, description='Date the certificate was issued (e.g., YYYY-MM).')
@@ -147,29 +174,39 @@ class CertificateItem(BaseModel):
 
 
 class ListCertificateItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[CertificateItem] = Field(default_factory=list)
 
 
 class InterestItem(BaseModel):
 	"""Represents an interest or hobby extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	interest_name: str = Field(..., description='Name of the interest or hobby.')
 	description: Optional[str] = Field(None, description='Brief description or details about the interest.')
 
 
 class ListInterestItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[InterestItem] = Field(default_factory=list)
 
 
 class KeywordItem(BaseModel):
 	"""Represents a single keyword extracted from the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	keyword: str = Field(..., description='An extracted keyword or key phrase.')
 
 
 class ListKeywordItem(BaseModel):
 	"""Represents a list of extracted keywords."""
 
+	model_config = _ITEM_CONFIG
+
 	items: List[KeywordItem] = Field(default_factory=list, description='A list of keywords.')
 
 
@@ -179,6 +216,8 @@ class ListKeywordItem(BaseModel):
 class InferredCharacteristicItem(BaseModel):
 	"""Represents an inferred characteristic about the candidate based on the CV."""
 
+	model_config = _ITEM_CONFIG
+
 	characteristic_type: str = Field(
 		...,
 		description='Type of characteristic (e.g., Potential Role, Key Strength, Soft Skill, Technical Expertise, Area for Development).',
@@ -191,9 +230,33 @@ class InferredCharacteristicItem(BaseModel):
 
 
 class ListInferredItem(BaseModel):
+	model_config = _ITEM_CONFIG
+
 	items: List[InferredCharacteristicItem] = Field(default_factory=list)
 
 
+# --- Fused Extraction Model ---
+
+
+class FusedCVExtraction(BaseModel):
+	"""All sections, keywords and the summary extracted from the CV in a single LLM call.
+
+	Field names match the CVState keys they populate.
+	"""
+
+	model_config = _ITEM_CONFIG
+
+	personal_info_item: Optional[PersonalInfoItem] = Field(None, description='Personal and contact details.')
+	education_items: ListEducationItem = Field(default_factory=ListEducationItem, description='Educational qualifications.')
+	work_experience_items: ListWorkExperienceItem = Field(default_factory=ListWorkExperienceItem, description='Work experience entries.')
+	skill_items: ListSkillItem = Field(default_factory=ListSkillItem, description='Skills.')
+	project_items: ListProjectItem = Field(default_factory=ListProjectItem, description='Projects.')
+	certificate_items: ListCertificateItem = Field(default_factory=ListCertificateItem, description='Certificates and courses.')
+	interest_items: ListInterestItem = Field(default_factory=ListInterestItem, description='Interests and hobbies.')
+	extracted_keywords: ListKeywordItem = Field(default_factory=ListKeywordItem, description='Key skills, technologies, roles and domain terms.')
+	cv_summary: str = Field(..., description='Concise 3-5 sentence professional summary of the candidate.')
+
+
 # --- CV Analysis Result Model (for final output) ---
 
 
@@ -203,6 +266,8 @@ class CVAnalysisResult(BaseModel):
 	This model is intended to be the final output returned to the user or calling service.
 	"""
 
+	model_config = ConfigDict(title='CVAnalysisResult')
+
 	raw_cv_content: Optional[str] = Field(None, description='The original CV content provided by the user.')
 	processed_cv_text: Optional[str] = Field(
 		None,
@@ -261,13 +326,19 @@ class CVAnalysisResult(BaseModel):
 		description="Information about the number of tokens used during LLM processing (e.g., {'input_tokens': 500, 'output_tokens': 1500, 'total_tokens': 2000}).",
 	)
 
-	class Config:
-		title = 'CVAnalysisResult'
-
 
 # --- LangGraph State Definition ---
 
 
+class TokenUsage(TypedDict):
+	"""Token counts and estimated cost of one CV analysis run."""
+
+	input_tokens: int
+	output_tokens: int
+	total_tokens: int
+	price_usd: float
+
+
 class CVState(TypedDict):
 	"""
 	Defines the state for the CV Analysis LangGraph Agent workflow.
@@ -275,9 +346,6 @@ class CVState(TypedDict):
 	as the CV is processed.
 	"""
 
-	# Core LangGraph message list, can be used for agent's internal monologue or conversational history
-	messages: Annotated[List, add_messages]
-
 	# Input and processed CV data
 	raw_cv_content: Optional[str]  # Initial input from user/service (Output of InputHandlerNode to ParserNode)
 	processed_cv_text: Optional[str]  # Cleaned CV text (Output of ParserNode)
@@ -312,8 +380,16 @@ class CVState(TypedDict):
 	inferred_characteristics: Optional[ListInferredItem]  # Changed from List[InferredCharacteristicItem]
 
 	# LLM usage tracking (Updated throughout the graph by various nodes)
-	token_usage: Optional[Dict[str, int]]
+	token_usage: Optional[TokenUsage]
+
+	# Steps that failed and fell back to an empty or placeholder value; parallel nodes append to it
+	failed_steps: Annotated[List[str], operator.add]
 
 	# Final aggregated result (Populated by OutputAggregatorNode)
 	# This field will hold the comprehensive CVAnalysisResult object.
 	final_analysis_result: Optional[CVAnalysisResult]
+
+
+# Build validators for the high-volume chunking models at import time instead of on the first request
+CVChunkWithSection.model_rebuild(force=True)
+LLMChunkingResult.model_rebuild(force=True)
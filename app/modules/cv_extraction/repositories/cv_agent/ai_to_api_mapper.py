@@ -1,63 +1,104 @@
-from typing import Optional, List
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, List
 from datetime import date, datetime
+from pydantic import TypeAdapter
 from app.modules.cv_extraction.repositories.cv_agent.agent_schema import CVAnalysisResult
-from app.modules.cv_extraction.schemas.cv import CVBase, EducationEntry, ExperienceEntry, ProjectEntry, CertificationEntry
+from app.modules.cv_extraction.schemas.cv import CVBase
+
+# Built once; validates the mapped payload in a single pydantic-core pass
+_CVBASE_ADAPTER = TypeAdapter(CVBase)
+
+# ISO-style dates the extractor emits: YYYY, YYYY-MM or YYYY-MM-DD
+_DATE_RE = re.compile(r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?")
 
 # Helper functions
+# Cached: CVs repeat date strings and dates are immutable, so parsing each distinct string once is safe
+@lru_cache(maxsize=1024)
 def parse_date(date_str: Optional[str]) -> Optional[date]:
     if not date_str:
         return None
-    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
+    match = _DATE_RE.fullmatch(date_str.strip())
+    if match:
+        year, month, day = match.groups()
         try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.date()
-        except Exception:
-            continue
-    return None
+            return date(int(year), int(month) if month else 1, int(day) if day else 1)
+        except ValueError:
+            return None
+    # Anything else ISO 8601 (compact dates, full timestamps) goes through the C parser in one call
+    try:
+        return datetime.fromisoformat(date_str.strip()).date()
+    except ValueError:
+        return None
 
+@lru_cache(maxsize=1024)
 def extract_year(date_str: Optional[str]) -> Optional[int]:
     d = parse_date(date_str)
     return d.year if d else None
 
+def _join_bullets(bullets: Optional[List[str]]) -> Optional[str]:
+    """Join responsibility bullets into one description, or None when there are none"""
+    return '; '.join(bullets) if bullets else None
+
+def _or_empty(value):
+    return value or ""
+
+def _or_empty_list(value):
+    return value or []
+
+def _identity(value):
+    return value
+
+# (target field, source field, transform) per CVBase entry; a None source always maps to None
+_EDUCATION_FIELDS = (
+    ("degree", "degree_name", _or_empty),
+    ("institution", "institution_name", _or_empty),
+    ("start_year", "graduation_date", extract_year),
+    ("end_year", "graduation_date", extract_year),
+    ("description", "description", _identity),
+)
+_EXPERIENCE_FIELDS = (
+    ("title", "job_title", _or_empty),
+    ("company", "company_name", _or_empty),
+    ("start_date", "start_date", parse_date),
+    ("end_date", "end_date", parse_date),
+    ("description", "responsibilities_achievements", _join_bullets),
+)
+_PROJECT_FIELDS = (
+    ("title", "project_name", _or_empty),
+    ("tech_stack", "technologies_used", _or_empty_list),
+    ("description", "description", _identity),
+)
+_CERTIFICATION_FIELDS = (
+    ("name", "certificate_name", _or_empty),
+    ("issuer", "issuing_organization", _identity),
+    ("time_period", "issue_date", parse_date),
+    ("description", None, _identity),
+)
+
+def _get(source, name: str):
+    return getattr(source, name, None)
+
+def _items(section) -> list:
+    return (_get(section, "items") or []) if section else []
+
+def _build(source, field_map) -> Dict[str, Any]:
+    return {target: transform(_get(source, name) if name else None) for target, name, transform in field_map}
+
 def ai_to_cvbase(ai_result: CVAnalysisResult) -> CVBase:
     pi = ai_result.personal_information
-    return CVBase(
-        name=pi.full_name if pi and pi.full_name else "",
-        email=pi.email if pi and pi.email else "",
-        phone=pi.phone_number if pi and pi.phone_number else None,
-        summary=ai_result.cv_summary,
-        education=[
-            EducationEntry(
-                degree=e.degree_name or "",
-                institution=e.institution_name or "",
-                start_year=extract_year(e.graduation_date),
-                end_year=extract_year(e.graduation_date),
-                description=e.description
-            ) for e in (ai_result.education_history.items if ai_result.education_history and ai_result.education_history.items else [])
-        ],
-        experience=[
-            ExperienceEntry(
-                title=w.job_title or "",
-                company=w.company_name or "",
-                start_date=parse_date(w.start_date),
-                end_date=parse_date(w.end_date),
-                description='; '.join(w.responsibilities_achievements) if w.responsibilities_achievements else None
-            ) for w in (ai_result.work_experience_history.items if ai_result.work_experience_history and ai_result.work_experience_history.items else [])
-        ],
-        skills=[s.skill_name for s in (ai_result.skills_summary.items if ai_result.skills_summary and ai_result.skills_summary.items else [])],
-        projects=[
-            ProjectEntry(
-                title=p.project_name or "",
-                tech_stack=p.technologies_used or [],
-                description=p.description
-            ) for p in (ai_result.projects_showcase.items if ai_result.projects_showcase and ai_result.projects_showcase.items else [])
-        ] if ai_result.projects_showcase else None,
-        certifications=[
-            CertificationEntry(
-                name=c.certificate_name or "",
-                issuer=c.issuing_organization,
-                time_period=parse_date(c.issue_date),
-                description=None
-            ) for c in (ai_result.certificates_and_courses.items if ai_result.certificates_and_courses and ai_result.certificates_and_courses.items else [])
-        ] if ai_result.certificates_and_courses else None,
-    ) 
\ No newline at end of file
+    projects_section = ai_result.projects_showcase
+    certificates_section = ai_result.certificates_and_courses
+    # Build plain dicts and validate once, so pydantic-core walks the nested payload in a single call
+    payload = {
+        "name": (pi.full_name or "") if pi else "",
+        "email": (pi.email or "") if pi else "",
+        "phone": (pi.phone_number or None) if pi else None,
+        "summary": ai_result.cv_summary,
+        "education": [_build(e, _EDUCATION_FIELDS) for e in _items(ai_result.education_history)],
+        "experience": [_build(w, _EXPERIENCE_FIELDS) for w in _items(ai_result.work_experience_history)],
+        "skills": [s.skill_name for s in _items(ai_result.skills_summary)],
+        "projects": [_build(p, _PROJECT_FIELDS) for p in _items(projects_section)] if projects_section else None,
+        "certifications": [_build(c, _CERTIFICATION_FIELDS) for c in _items(certificates_section)] if certificates_section else None,
+    }
+    return _CVBASE_ADAPTER.validate_python(payload)
@@ -1,12 +1,22 @@
+import asyncio
+import contextvars
+import hashlib
+import itertools
 import logging
+import random
 import uuid
 import re
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
-from typing import Literal
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+import orjson
+from pydantic import BaseModel, create_model
 
 from app.modules.cv_extraction.repositories.cv_agent.agent_schema import (
+	CVChunkWithSection,
 	CVState,
+	FusedCVExtraction,
+	LLMChunkingResult,
 	ListInferredItem,
 	PersonalInfoItem,
 	CVAnalysisResult,
@@ -18,13 +28,22 @@ from app.modules.cv_extraction.repositories.cv_agent.agent_schema import (
 	ListInterestItem,  # Added import
 	ListKeywordItem,  # Added import
 )
+from app.core.config import (
+	CV_EXTRACTION_CACHE_TIMEOUT,
+	CV_EXTRACTION_CACHE_URL,
+	CV_FUSED_EXTRACTION,
+	CV_LIGHT_EXTRACTION_MODEL,
+)
 from app.modules.cv_extraction.repositories.cv_agent.llm_setup import initialize_llm
 from app.modules.cv_extraction.repositories.cv_agent.prompt import (
 	CV_CLEANING_PROMPT,
-	SECTION_IDENTIFICATION_PROMPT,
 	GENERAL_EXTRACTION_SYSTEM_PROMPT,
-	EXTRACT_SECTION_PROMPT_TEMPLATE,
+	EXTRACT_SECTIONS_PROMPT_TEMPLATE,
+	EXTRACT_CHUNKED_SECTION_PROMPT,
+	LLM_CHUNKING_SYSTEM_PROMPT,
+	LLM_CHUNKING_USER_PROMPT,
 	EXTRACT_KEYWORDS_PROMPT,
+	FUSED_EXTRACTION_PROMPT,
 	CV_JD_ALIGNMENT_PROMPT ,
 	CV_SUMMARY_PROMPT,
 	INFERENCE_SYSTEM_PROMPT,
@@ -33,34 +52,137 @@ from app.modules.cv_extraction.repositories.cv_agent.prompt import (
 from app.modules.cv_extraction.repositories.cv_agent.utils import (
 	TokenTracker,
 	count_tokens,
-	calculate_price,
 )
-from langgraph.checkpoint.memory import MemorySaver
+from app.utils.redis_client import RedisClient
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, START, END
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 
+# LLM step results are cached by content hash; bump PROMPT_VERSION whenever a prompt or schema changes
+EXTRACTION_CACHE_PREFIX = 'cv_extract'
+EXTRACTION_CACHE_TTL = 7 * 24 * 3600
+PROMPT_VERSION = '4'
+
+# Entries hold candidate PII (cleaned CV text, personal info), so the cache only exists when a URL is configured
+_extraction_cache = RedisClient(CV_EXTRACTION_CACHE_URL, timeout=CV_EXTRACTION_CACHE_TIMEOUT) if CV_EXTRACTION_CACHE_URL else None
+
+
+async def _cache_get(cache_key: str) -> Any:
+	"""Read a cached step result; always a miss when the cache is disabled."""
+	if _extraction_cache is None:
+		return None
+	return await _extraction_cache.get(cache_key)
+
+
+async def _cache_set(cache_key: str, payload: Any) -> None:
+	"""Store a step result; a no-op when the cache is disabled."""
+	if _extraction_cache is not None:
+		await _extraction_cache.set(cache_key, payload, ttl=EXTRACTION_CACHE_TTL)
+
+# Token counts of the analysis running in the current task, so concurrent runs on one workflow stay separate
+_current_token_tracker: contextvars.ContextVar[TokenTracker] = contextvars.ContextVar('cv_token_tracker')
+
+
+class _LLMSlot(NamedTuple):
+	"""Clients of one API key, with the semaphore bounding in-flight calls against that key."""
+
+	llm: Any
+	light_llm: Any
+	semaphore: asyncio.Semaphore
+
+
+# API key slot assigned to the analysis running in the current task
+_current_llm_slot: contextvars.ContextVar[_LLMSlot] = contextvars.ContextVar('cv_llm_slot')
+
+# In-flight LLM steps by cache key, so concurrent requests for the same content share a single LLM call
+_inflight_steps: Dict[str, asyncio.Task] = {}
+
+
+def _cache_key(step: str, llm: Any, *parts: str) -> str:
+	"""Build a cache key from the step, model, prompt version and length-prefixed content parts."""
+	digest = hashlib.sha256()
+	for part in (PROMPT_VERSION, getattr(llm, 'model', ''), *parts):
+		encoded = (part or '').encode()
+		digest.update(len(encoded).to_bytes(8, 'big'))
+		digest.update(encoded)
+	return f'{EXTRACTION_CACHE_PREFIX}:{step}:{digest.hexdigest()}'
+
+# Flat, low-ambiguity sections that the lighter extraction model handles reliably
+LIGHT_MODEL_SECTIONS = frozenset({'education', 'skills', 'certificates', 'interests'})
+
+# Upper bound on concurrent LLM requests from one workflow instance
+MAX_CONCURRENT_LLM_CALLS = 5
+
+# Inputs shorter than this (after stripping whitespace) cannot be a CV and skip all LLM calls
+MIN_CV_CHARS = 100
+
+
+# Whitespace and control-character noise in the cleaned CV, which every downstream prompt would otherwise pay for
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+_INLINE_SPACE_RE = re.compile(r'[ \t]+')
+_LINE_EDGE_SPACE_RE = re.compile(r' ?\n ?')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _normalize_cv_text(text: str) -> str:
+	"""Drop control characters, collapse runs of spaces/tabs and more than one blank line."""
+	text = _CONTROL_CHARS_RE.sub('', text.replace('\r\n', '\n'))
+	text = _INLINE_SPACE_RE.sub(' ', text)
+	text = _LINE_EDGE_SPACE_RE.sub('\n', text)
+	return _BLANK_LINES_RE.sub('\n\n', text).strip()
 
-# Schemas for LLM-based CV Chunking and Classification
-class CVChunkWithSection(BaseModel):
-	"""A chunk of CV content with its classified section type."""
 
-	chunk_content: str = Field(description='The actual text content of this chunk')
-	section: Literal[
-		'personal_info',
-		'education',
-		'work_experience',
-		'skills',
-		'projects',
-		'certificates',
-		'interests',
-		'other',
-	] = Field(description='Section type determined by LLM during chunking')
+def _compact_json(value: Any) -> str:
+	"""Render extracted data as compact JSON for a prompt, leaving out unset fields."""
+	if isinstance(value, BaseModel):
+		value = value.model_dump(mode='json', exclude_none=True)
+	elif isinstance(value, (list, tuple)):
+		value = [item.model_dump(mode='json', exclude_none=True) if isinstance(item, BaseModel) else item for item in value]
+	return orjson.dumps(value).decode()
 
 
-class LLMChunkingResult(BaseModel):
-	"""Result of LLM-based intelligent chunking and classification."""
+def _is_too_short(text: Optional[str]) -> bool:
+	"""Whether text is too short (after stripping whitespace) to be worth an LLM call."""
+	return len((text or '').strip()) < MIN_CV_CHARS
 
-	chunks: List[CVChunkWithSection] = Field(description='List of intelligently chunked and classified CV sections')
+# Re-asks after a structured output fails to parse, with the parse error fed back to the model
+MAX_STRUCTURED_RETRIES = 2
+# Base delay in seconds of the exponential, jittered backoff between those re-asks
+STRUCTURED_RETRY_BASE_DELAY = 1.0
+
+
+def _raw_output_text(message: Any) -> str:
+	"""Text of a raw structured-output reply: the tool-call arguments when present, else the message content."""
+	tool_calls = getattr(message, 'tool_calls', None)
+	if tool_calls:
+		return orjson.dumps(tool_calls[0].get('args', {}), default=str).decode()
+	return str(getattr(message, 'content', '') or '')
+
+
+def _reported_usage(message: Any) -> Optional[Tuple[int, int]]:
+	"""
+	Reads provider-reported (input_tokens, output_tokens) from an LLM response message.
+
+	Prefers LangChain's standard usage_metadata and falls back to the raw usage block in
+	response_metadata; returns None when the provider reported neither.
+	"""
+	usage = getattr(message, 'usage_metadata', None)
+	if usage:
+		return usage.get('input_tokens', 0), usage.get('output_tokens', 0)
+
+	response_metadata = getattr(message, 'response_metadata', None) or {}
+	raw_usage = response_metadata.get('usage_metadata') or response_metadata.get('token_usage')
+	if raw_usage:
+		input_tokens = raw_usage.get('prompt_token_count', raw_usage.get('prompt_tokens', 0))
+		output_tokens = raw_usage.get('candidates_token_count', raw_usage.get('completion_tokens', 0))
+		return input_tokens, output_tokens
+	return None
+
+
+@lru_cache(maxsize=None)
+def _merged_section_schema(sections: Tuple[Tuple[str, type], ...]) -> type:
+	"""Build (once per section combination) a schema with one optional field per section type."""
+	return create_model('CVSectionsExtraction', **{section_type: (Optional[schema], None) for section_type, schema in sections})
 
 
 class CVProcessorWorkflow:
@@ -69,215 +191,438 @@ class CVProcessorWorkflow:
 	and graph construction based on the PlantUML diagram.
 	"""
 
-	def __init__(self, api_key: str):
+	# Schema mapping for LLM-based extraction: section type -> (schema, state key)
+	TYPE_TO_SCHEMA_MAP: ClassVar[Dict[str, Tuple[type, str]]] = {
+		'personal_info': (PersonalInfoItem, 'personal_info_item'),
+		'education': (ListEducationItem, 'education_items'),
+		'work_experience': (ListWorkExperienceItem, 'work_experience_items'),
+		'skills': (ListSkillItem, 'skill_items'),
+		'projects': (ListProjectItem, 'project_items'),
+		'certificates': (ListCertificateItem, 'certificate_items'),
+		'interests': (ListInterestItem, 'interest_items'),
+	}
+
+	def __init__(self, api_key: Union[str, Sequence[str]], *, checkpointer: Optional[BaseCheckpointSaver] = None, fused_extraction: bool = CV_FUSED_EXTRACTION):
+		"""
+		Args:
+		    api_key: Google API key for the Gemini models, or a pool of keys; each analysis is assigned
+		        the next key round-robin and the concurrency limit applies per key
+		    checkpointer: Optional LangGraph checkpointer (e.g. MemorySaver()) for callers that resume runs;
+		        by default no state is checkpointed between nodes
+		    fused_extraction: Extract sections, keywords and summary in one LLM call, falling back to
+		        chunking plus per-step extraction only if that call fails
+		"""
 		self.logger = logging.getLogger(self.__class__.__name__)
-		self.llm = initialize_llm(api_key)
-		self.token_tracker = TokenTracker()
-		self.memory = MemorySaver()  # In-memory checkpointer for state
+		api_keys = [api_key] if isinstance(api_key, str) else list(api_key)
+		self._llm_slots = [
+			_LLMSlot(initialize_llm(key), initialize_llm(key, model=CV_LIGHT_EXTRACTION_MODEL), asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS))
+			for key in api_keys
+		]
+		self._next_llm_slot = itertools.cycle(self._llm_slots)
+		self._default_token_tracker = TokenTracker()
+		self.checkpointer = checkpointer
+		self.fused_extraction = fused_extraction
+		self._structured_llm_cache: Dict[Tuple[int, type], Any] = {}
+		for slot in self._llm_slots:
+			for section_type, (schema, _) in self.TYPE_TO_SCHEMA_MAP.items():
+				self._structured(slot.light_llm if section_type in LIGHT_MODEL_SECTIONS else slot.llm, schema)
+			for schema in (LLMChunkingResult, ListKeywordItem, ListInferredItem, FusedCVExtraction):
+				self._structured(slot.llm, schema)
 		self.workflow = self._build_graph()
 
-	# --- Node Definitions ---
+	def _track_usage(self, response: AIMessage, prompt: str) -> tuple[int, int]:
+		"""
+		Records token usage of a plain LLM call.
 
-	async def input_handler_node(self, state: CVState) -> Dict[str, Any]:
-		"""Handles initial input and starts the process."""
-		if not state.get('raw_cv_content'):
-			self.logger.warning('No raw_cv_content provided.')
-			return {'raw_cv_content': ''}
-		return {
-			'raw_cv_content': state['raw_cv_content'],
-			'messages': [SystemMessage(content='CV analysis process started.')],
-		}
+		Uses the provider-reported usage_metadata on the response and falls back to
+		the local length-based estimate when the provider does not report it.
 
-	async def cv_parser_node(self, state: CVState) -> Dict[str, Any]:
-		"""Cleans and structures the raw CV content."""
-		raw_cv_content = state.get('raw_cv_content', '')
+		Args:
+		    response: AIMessage returned by the LLM
+		    prompt: Prompt sent, used only for the fallback estimate
 
-		prompt = CV_CLEANING_PROMPT.format(raw_cv_content=raw_cv_content)
-		input_tokens = count_tokens(prompt, 'gemini')
+		Returns:
+		    Tuple of (input_tokens, output_tokens) recorded
+		"""
+		usage = _reported_usage(response)
+		if usage:
+			input_tokens, output_tokens = usage
+		else:
+			input_tokens, output_tokens = count_tokens(prompt, 'gemini'), count_tokens(response.content, 'gemini')
 		self.token_tracker.add_input_tokens(input_tokens)
+		self.token_tracker.add_output_tokens(output_tokens)
+		return input_tokens, output_tokens
 
-		response = await self.llm.ainvoke(prompt)
-		processed_cv_text = response.content
+	@property
+	def token_tracker(self) -> TokenTracker:
+		"""Token tracker of the analysis running in the current task."""
+		return _current_token_tracker.get(self._default_token_tracker)
 
-		output_tokens = count_tokens(processed_cv_text, 'gemini')
-		self.token_tracker.add_output_tokens(output_tokens)
+	@property
+	def _llm_slot(self) -> _LLMSlot:
+		"""API key slot of the analysis running in the current task."""
+		return _current_llm_slot.get(self._llm_slots[0])
 
-		return {
-			'processed_cv_text': processed_cv_text,
-			'messages': state.get('messages', []) + [AIMessage(content=f'CV parsed. Cleaned text length: {len(processed_cv_text)}')],
-		}
+	@property
+	def llm(self) -> Any:
+		return self._llm_slot.llm
 
-	async def section_identifier_node(self, state: CVState) -> Dict[str, Any]:
-		"""Identifies sections within the processed CV text."""
-		processed_cv_text = state.get('processed_cv_text', '')
+	@property
+	def light_llm(self) -> Any:
+		return self._llm_slot.light_llm
 
-		prompt = SECTION_IDENTIFICATION_PROMPT.format(processed_cv_text=processed_cv_text)
-		input_tokens = count_tokens(prompt, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens)
+	@property
+	def llm_semaphore(self) -> asyncio.Semaphore:
+		return self._llm_slot.semaphore
 
-		response = await self.llm.ainvoke(prompt)
-		identified_sections_str = response.content
-		output_tokens = count_tokens(identified_sections_str, 'gemini')
-		self.token_tracker.add_output_tokens(output_tokens)
+	async def _cached(self, cache_key: str, decode: Callable[[Any], Any], compute: Callable[[], Awaitable[Tuple[Any, Any]]]) -> Any:
+		"""
+		Returns a cached LLM step result, or computes and stores it.
 
-		identified_sections = []
-		try:
-			# Attempt to remove markdown code block fences if present
-			cleaned_str = identified_sections_str.strip()
-			if cleaned_str.startswith('```json'):
-				cleaned_str = cleaned_str[len('```json') :]
-			if cleaned_str.startswith('```'):  # General markdown fence
-				cleaned_str = cleaned_str[len('```') :]
-			if cleaned_str.endswith('```'):
-				cleaned_str = cleaned_str[: -len('```')]
-			cleaned_str = cleaned_str.strip()
-
-			# Parse the cleaned string as JSON
-			if cleaned_str.startswith('[') and cleaned_str.endswith(']'):
-				# Use json.loads for safety instead of eval
-				import json  # Make sure json is imported
-
-				identified_sections = json.loads(cleaned_str)
-				if not isinstance(identified_sections, list) or not all(isinstance(s, str) for s in identified_sections):
-					self.logger.warning('Parsed JSON is not a list of strings.')
-					identified_sections = []  # Reset if not a list of strings
-
-			# Fallback for simple comma-separated strings if JSON parsing fails or wasn't appropriate
-			if not identified_sections and not (cleaned_str.startswith('[') and cleaned_str.endswith(']')):
-				identified_sections = [s.strip() for s in cleaned_str.split(',') if s.strip()]
+		Args:
+		    cache_key: Key from _cache_key
+		    decode: Turns the cached JSON payload back into the step result
+		    compute: Runs the LLM step and returns (result, JSON payload or None to skip caching)
 
-		except Exception as e:
-			self.logger.error(f"Error parsing identified sections string '{identified_sections_str}': {e}. Defaulting to empty list.")
-			identified_sections = []  # Ensure it's an empty list on any error
+		Returns:
+		    The step result
+		"""
+		task = _inflight_steps.get(cache_key)
+		if task is None:
+			# The task runs in a copy of this context, so its token usage is charged to the first caller only
+			task = asyncio.create_task(self._lookup_or_compute(cache_key, decode, compute))
+			_inflight_steps[cache_key] = task
+
+			def forget(done: asyncio.Task) -> None:
+				if _inflight_steps.get(cache_key) is done:
+					del _inflight_steps[cache_key]
+
+			task.add_done_callback(forget)
+		else:
+			self.logger.info(f'Joining in-flight step {cache_key}')
+
+		# Shielded so one cancelled caller does not cancel the call the others are waiting on
+		return await asyncio.shield(task)
+
+	async def _lookup_or_compute(self, cache_key: str, decode: Callable[[Any], Any], compute: Callable[[], Awaitable[Tuple[Any, Any]]]) -> Any:
+		"""Body of _cached for the first caller of a key: cache lookup, then the LLM step and cache write."""
+		cached = await _cache_get(cache_key)
+		if cached is not None:
+			try:
+				self.logger.info(f'Cache hit for {cache_key}')
+				return decode(cached)
+			except Exception as e:
+				self.logger.warning(f'Ignoring invalid cache entry {cache_key}: {e}')
+
+		result, payload = await compute()
+		if payload is not None:
+			await _cache_set(cache_key, payload)
+		return result
+
+	def _structured(self, llm: Any, schema: type) -> Any:
+		"""Returns the structured-output runnable for a model and schema, building it only once."""
+		key = (id(llm), schema)
+		structured_llm = self._structured_llm_cache.get(key)
+		if structured_llm is None:
+			structured_llm = self._structured_llm_cache[key] = llm.with_structured_output(schema, include_raw=True)
+		return structured_llm
+
+	async def _ainvoke_structured(self, llm: Any, schema: type, prompt: Any) -> Any:
+		"""
+		Runs a structured-output call and records the provider-reported token usage.
+
+		The raw AIMessage is requested alongside the parsed model, so usage comes from
+		its usage_metadata instead of re-serializing the parsed model to estimate it.
+		When the output does not validate against the schema, the error is appended to the
+		conversation after the model's own failed output and the call is retried up to
+		MAX_STRUCTURED_RETRIES times, with exponential backoff and jitter between attempts.
+		Each attempt holds an llm_semaphore slot only while its request is in flight, not
+		during the backoff between attempts.
+
+		Args:
+		    llm: Chat model to call
+		    schema: Pydantic model the output is parsed into
+		    prompt: Prompt string or message list
+
+		Returns:
+		    The parsed schema instance
+		"""
+		structured_llm = self._structured(llm, schema)
+		messages = list(prompt) if isinstance(prompt, list) else [HumanMessage(content=prompt)]
 
-		# Ensure all items are strings, just in case of mixed types from a lenient parse
-		identified_sections = [str(s) for s in identified_sections if isinstance(s, (str, int, float))]
+		for attempt in range(MAX_STRUCTURED_RETRIES + 1):
+			async with self.llm_semaphore:
+				result = await structured_llm.ainvoke(messages)
+			parsed = result.get('parsed')
 
-		return {
-			'identified_sections': identified_sections,
-			'messages': state.get('messages', []) + [AIMessage(content=f'Identified sections: {", ".join(identified_sections)}')],
-		}
+			usage = _reported_usage(result.get('raw'))
+			if usage:
+				input_tokens, output_tokens = usage
+			else:
+				prompt_text = '\n'.join(str(message.content) for message in messages)
+				output_text = parsed.model_dump_json() if isinstance(parsed, BaseModel) else str(result.get('raw', ''))
+				input_tokens, output_tokens = count_tokens(prompt_text, 'gemini'), count_tokens(output_text, 'gemini')
+			self.token_tracker.add_input_tokens(input_tokens)
+			self.token_tracker.add_output_tokens(output_tokens)
+
+			parsing_error = result.get('parsing_error')
+			if parsing_error is None or parsed is not None:
+				return parsed
+			if attempt == MAX_STRUCTURED_RETRIES:
+				raise parsing_error
+
+			self.token_tracker.add_retry()
+			self.logger.warning(f'Structured output for {schema.__name__} failed validation (attempt {attempt + 1}), retrying: {parsing_error}')
+			messages.append(AIMessage(content=_raw_output_text(result.get('raw'))))
+			messages.append(HumanMessage(content=f'Your output had error: {parsing_error}. Fix and retry.'))
+			await asyncio.sleep(STRUCTURED_RETRY_BASE_DELAY * 2**attempt + random.uniform(0, STRUCTURED_RETRY_BASE_DELAY))
+
+	# --- Node Definitions ---
+
+	async def input_handler_node(self, state: CVState) -> Dict[str, Any]:
+		"""Handles initial input and starts the process; degenerate input ends the run with a placeholder result."""
+		raw_cv_content = state.get('raw_cv_content') or ''
+		if _is_too_short(raw_cv_content):
+			self.logger.warning(f'Empty or too short raw_cv_content ({len(raw_cv_content)} chars), skipping analysis.')
+			return {
+				'raw_cv_content': raw_cv_content,
+				'final_analysis_result': CVAnalysisResult(
+					raw_cv_content=raw_cv_content,
+					cv_summary='Empty or invalid CV input',
+					llm_token_usage=self.token_tracker.usage(),
+				),
+			}
+
+		# Identical CV (and job description) analyzed before: end the run with the stored result
+		cache_key = self._result_cache_key(raw_cv_content, state.get('job_description'))
+		cached = await _cache_get(cache_key)
+		if cached is not None:
+			try:
+				cached_result = CVAnalysisResult.model_validate(cached)
+				cached_result.raw_cv_content = raw_cv_content
+				cached_result.llm_token_usage = self.token_tracker.usage()
+				self.logger.info(f'Cache hit for {cache_key}, skipping analysis.')
+				return {'raw_cv_content': raw_cv_content, 'final_analysis_result': cached_result}
+			except Exception as e:
+				self.logger.warning(f'Ignoring invalid cache entry {cache_key}: {e}')
+
+		self.logger.info('CV analysis process started.')
+		return {'raw_cv_content': state['raw_cv_content']}
+
+	def _result_cache_key(self, raw_cv_content: str, job_description: Optional[str]) -> str:
+		"""Cache key of a complete analysis; the job description shapes the summary and alignment, so it is part of the key."""
+		return _cache_key('result', self.llm, raw_cv_content, job_description or '')
+
+	async def cv_parser_node(self, state: CVState) -> Dict[str, Any]:
+		"""Cleans and structures the raw CV content."""
+		raw_cv_content = state.get('raw_cv_content', '')
+
+		prompt = CV_CLEANING_PROMPT.format(raw_cv_content=raw_cv_content)
+
+		async def compute():
+			async with self.llm_semaphore:
+				response = await self.llm.ainvoke(prompt)
+			self._track_usage(response, prompt)
+			return response.content, response.content
+
+		processed_cv_text = _normalize_cv_text(await self._cached(_cache_key('clean', self.llm, raw_cv_content), str, compute))
+
+		self.logger.info(f'CV parsed. Cleaned text length: {len(processed_cv_text)}')
+		return {'processed_cv_text': processed_cv_text}
 
 	async def llm_chunk_decision_node(self, state: CVState) -> Dict[str, Any]:
 		"""Uses LLM to intelligently chunk and classify CV content in one step."""
 		processed_cv_text = state.get('processed_cv_text', '')
 
-		if not processed_cv_text:
-			self.logger.warning('No processed CV text available for chunking.')
-			return {
-				'chunking_result': LLMChunkingResult(chunks=[]),
-				'messages': state.get('messages', []) + [AIMessage(content='No CV content to chunk and classify.')],
-			}
+		if _is_too_short(processed_cv_text):
+			self.logger.warning('No usable processed CV text available for chunking.')
+			return {'chunking_result': LLMChunkingResult(chunks=[])}
 
-		# LLM-based intelligent chunking and classification prompt
-		chunking_prompt = f"""
-You are an expert CV analyzer. Read the following CV content and intelligently divide it into logical chunks, where each chunk represents a coherent section of the CV.
-
-**Section Types Available:**
-- personal_info: Personal details, contact information, profile, summary, bio, introduction
-- education: Academic background, degrees, schools, universities, qualifications, studies  
-- work_experience: Employment history, professional experience, career, jobs, positions
-- skills: Technical skills, competencies, abilities, expertise, languages, technologies
-- projects: Personal projects, portfolio, case studies, achievements, works
-- certificates: Certifications, licenses, courses, training, credentials, workshops
-- interests: Hobbies, activities, personal interests, volunteering, recreational activities
-- other: Any content that doesn't fit the above categories
-
-**CV Content:**
-{processed_cv_text}
-
-**Instructions:**
-1. Analyze the content semantically and divide into logical chunks
-2. Each chunk should contain related information that belongs to the same section type
-3. Don't break up coherent information across multiple chunks
-4. Classify each chunk into the most appropriate section type
-5. Ensure personal information is captured completely in one chunk
-6. Make sure no important information is lost
-
-**Expected Output Format:**
-Return a list of chunks where each chunk has:
-- chunk_content: The actual text content
-- section: The classified section type
-
-Focus on semantic understanding and logical grouping, not keyword matching.
-"""
-
-		input_tokens = count_tokens(chunking_prompt, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens)
-		structured_llm = self.llm.with_structured_output(LLMChunkingResult)
+		chunking_prompt = [
+			SystemMessage(content=LLM_CHUNKING_SYSTEM_PROMPT),
+			HumanMessage(content=LLM_CHUNKING_USER_PROMPT.format(processed_cv_text=processed_cv_text)),
+		]
 
 		try:
-			chunking_result = await structured_llm.ainvoke(chunking_prompt)
-			output_tokens = count_tokens(str(chunking_result), 'gemini')
-			self.token_tracker.add_output_tokens(output_tokens)
-			return {
-				'chunking_result': chunking_result,
-				'messages': state.get('messages', []) + [AIMessage(content=f'Intelligently chunked CV into {len(chunking_result.chunks)} logical sections using LLM analysis.')],
-			}
+			chunking_result = await self._ainvoke_structured(self.llm, LLMChunkingResult, chunking_prompt)
+			self.logger.info(f'Intelligently chunked CV into {len(chunking_result.chunks)} logical sections using LLM analysis.')
+			return {'chunking_result': chunking_result}
 		except Exception as e:
 			self.logger.error(f'Error during intelligent chunking: {e}')
 			fallback_chunks = [CVChunkWithSection(chunk_content=processed_cv_text, section='other')]
-			return {
-				'chunking_result': LLMChunkingResult(chunks=fallback_chunks),
-				'messages': state.get('messages', []) + [AIMessage(content=f'Error during intelligent chunking: {e}')],
-			}
+			return {'chunking_result': LLMChunkingResult(chunks=fallback_chunks), 'failed_steps': ['chunking']}
 
-	async def _extract_structured_data(self, cv_text_portion: str, schema: type, section_title: str) -> Optional[BaseModel]:  # Changed return type
-		"""Helper to extract data for a given schema using with_structured_output."""
-		self.logger.info(f"InformationExtractorNode: Extracting data for section '{section_title}' with schema {schema.__name__}.")
+	async def _extract_section(self, section_type: str, combined_content: str, schema: type) -> BaseModel:
+		"""
+		Extracts one section type from its chunks with a structured-output LLM call.
 
-		system_prompt_with_schema = f'{GENERAL_EXTRACTION_SYSTEM_PROMPT}\n\nThe output MUST be structured according to the following Pydantic schema'
+		Args:
+		    section_type: Section type shared by the chunks
+		    combined_content: Content of all chunks classified as this section type
+		    schema: Pydantic model the LLM output is parsed into
 
-		user_prompt = EXTRACT_SECTION_PROMPT_TEMPLATE.format(section_title=section_title, cv_text_portion=cv_text_portion)
+		Returns:
+		    The parsed schema instance; exceptions propagate to the caller
+		"""
+		self.logger.info(f"InformationExtractorNode: Processing section type '{section_type}'")
 
-		full_prompt_for_tokens = system_prompt_with_schema + '\n' + user_prompt
-		input_tokens = count_tokens(full_prompt_for_tokens, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens)
+		self.logger.info(f'InformationExtractorNode: Combined content length: {len(combined_content)} characters')
+		self.logger.info(f'InformationExtractorNode: Using schema: {schema.__name__}')
 
-		structured_llm = self.llm.with_structured_output(schema)
+		extraction_prompt = EXTRACT_CHUNKED_SECTION_PROMPT.format(section_type=section_type, combined_content=combined_content)
 
-		try:
-			# Call the LLM to get structured data
-			result_from_llm = await structured_llm.ainvoke([
-				SystemMessage(content=system_prompt_with_schema),
-				HumanMessage(content=user_prompt),
-			])
-
-			actual_instance: Optional[BaseModel] = None
-			if isinstance(result_from_llm, list) and len(result_from_llm) == 1 and isinstance(result_from_llm[0], schema):
-				# If LLM wraps the single instance in a list, unwrap it.
-				actual_instance = result_from_llm[0]
-				self.logger.info(f'Unwrapped instance from list for {section_title}')
-			elif isinstance(result_from_llm, schema):
-				# LLM returned SchemaInstance directly.
-				actual_instance = result_from_llm
-			else:
-				self.logger.error(f'Unexpected type from LLM for {section_title} (expected {schema.__name__}, got {type(result_from_llm)}). Value: {result_from_llm}')
-				return None  # Return None if type is unexpected
-
-			if actual_instance is not None:
-				output_tokens = count_tokens(str(actual_instance), 'gemini')  # Calculate tokens based on the actual instance
-				self.token_tracker.add_output_tokens(output_tokens)
-				self.logger.info(f"InformationExtractorNode: Successfully extracted data for '{section_title}' using schema {schema.__name__}.")
-			return actual_instance  # Return the direct instance or None
-		except Exception as e:
-			self.logger.error(
-				f"InformationExtractorNode: Error extracting '{section_title}' with schema {schema.__name__}: {e}",
-				exc_info=True,
-			)
-			return None  # Return None on error
+		llm = self._section_llm(section_type)
+
+		async def compute():
+			self.logger.info(f'InformationExtractorNode: Invoking LLM for {section_type} extraction...')
+			extracted_items = await self._ainvoke_structured(llm, schema, extraction_prompt)
+
+			self.logger.info(f'InformationExtractorNode: LLM extraction successful for {section_type}')
+			self.logger.debug('InformationExtractorNode: Extracted items for %s: %s', section_type, extracted_items)
+			return extracted_items, extracted_items.model_dump() if isinstance(extracted_items, schema) else None
+
+		cache_key = self._section_cache_key(section_type, llm, schema, combined_content)
+		return await self._cached(cache_key, schema.model_validate, compute)
+
+	def _section_llm(self, section_type: str) -> Any:
+		"""Returns the chat model that extracts the given section type."""
+		return self.light_llm if section_type in LIGHT_MODEL_SECTIONS else self.llm
+
+	@staticmethod
+	def _section_cache_key(section_type: str, llm: Any, schema: type, combined_content: str) -> str:
+		"""Cache key of one section extraction; boilerplate sections repeat across candidates, so it uses whitespace-normalized content."""
+		normalized_content = ' '.join(combined_content.split())
+		return _cache_key(f'section:{section_type}', llm, schema.__name__, normalized_content)
+
+	async def _extract_merged_sections(self, llm: Any, section_jobs: List[Tuple[str, str]]) -> Dict[str, Any]:
+		"""
+		Extracts several section types handled by the same model in one structured-output call.
+
+		Sections found in the per-section cache are not sent to the LLM; the rest are filled
+		through a schema built from only their sub-schemas and cached one by one afterwards.
+
+		Args:
+		    llm: Chat model that handles all the given section types
+		    section_jobs: (section_type, combined_content) pairs to extract
+
+		Returns:
+		    Mapping of section type to its parsed schema instance (None if the LLM returned nothing for it)
+		"""
+		jobs = []
+		for section_type, combined_content in section_jobs:
+			schema = self.TYPE_TO_SCHEMA_MAP[section_type][0]
+			jobs.append((section_type, schema, combined_content, self._section_cache_key(section_type, llm, schema, combined_content)))
+
+		# Look all sections up in one round of concurrent cache reads
+		cached_entries = await asyncio.gather(*(_cache_get(cache_key) for _, _, _, cache_key in jobs))
+
+		results: Dict[str, Any] = {}
+		pending = []
+		for (section_type, schema, combined_content, cache_key), cached in zip(jobs, cached_entries):
+			if cached is not None:
+				try:
+					results[section_type] = schema.model_validate(cached)
+					self.logger.info(f'Cache hit for {cache_key}')
+					continue
+				except Exception as e:
+					self.logger.warning(f'Ignoring invalid cache entry {cache_key}: {e}')
+			pending.append((section_type, schema, combined_content, cache_key))
+
+		if not pending:
+			return results
+
+		merged_schema = _merged_section_schema(tuple((section_type, schema) for section_type, schema, _, _ in pending))
+		sections_content = '\n\n'.join(f'### {section_type}\n{combined_content}' for section_type, _, combined_content, _ in pending)
+		prompt = [
+			SystemMessage(content=GENERAL_EXTRACTION_SYSTEM_PROMPT),
+			HumanMessage(content=EXTRACT_SECTIONS_PROMPT_TEMPLATE.format(sections_content=sections_content)),
+		]
+
+		self.logger.info(f'InformationExtractorNode: Invoking LLM once for sections {[section_type for section_type, _, _, _ in pending]}')
+		merged = await self._ainvoke_structured(llm, merged_schema, prompt)
+
+		cache_writes = []
+		for section_type, schema, _, cache_key in pending:
+			extracted_items = getattr(merged, section_type, None)
+			if isinstance(extracted_items, schema):
+				cache_writes.append(_cache_set(cache_key, extracted_items.model_dump()))
+			results[section_type] = extracted_items
+		await asyncio.gather(*cache_writes)
+		return results
+
+	async def _extract_sections(self, section_jobs: List[Tuple[str, str]]) -> Dict[str, Any]:
+		"""
+		Extracts all mapped section types with at most one LLM call per extraction model.
+
+		Args:
+		    section_jobs: (section_type, combined_content) pairs to extract
+
+		Returns:
+		    Mapping of section type to its parsed schema instance, or the exception raised while extracting it
+		"""
+		jobs_by_model: Dict[int, Tuple[Any, List[Tuple[str, str]]]] = {}
+		for section_type, combined_content in section_jobs:
+			llm = self._section_llm(section_type)
+			jobs_by_model.setdefault(id(llm), (llm, []))[1].append((section_type, combined_content))
+
+		groups = list(jobs_by_model.values())
+
+		async def extract_group(llm: Any, jobs: List[Tuple[str, str]]) -> Dict[str, Any]:
+			if len(jobs) == 1:
+				section_type, combined_content = jobs[0]
+				return {section_type: await self._extract_section(section_type, combined_content, self.TYPE_TO_SCHEMA_MAP[section_type][0])}
+			return await self._extract_merged_sections(llm, jobs)
+
+		group_results = await asyncio.gather(*(extract_group(llm, jobs) for llm, jobs in groups), return_exceptions=True)
+
+		results: Dict[str, Any] = {}
+		for (_, jobs), group_result in zip(groups, group_results):
+			for section_type, _ in jobs:
+				results[section_type] = group_result if isinstance(group_result, Exception) else group_result.get(section_type)
+		return results
+
+	async def _extract_keywords(self, processed_cv_text: str) -> Any:
+		"""Extracts general keywords from the whole CV text."""
+		self.logger.info('KeywordExtractorNode: Starting keyword extraction phase')
+		keyword_prompt = EXTRACT_KEYWORDS_PROMPT.format(processed_cv_text=processed_cv_text)
+
+		async def compute():
+			self.logger.info('KeywordExtractorNode: Invoking LLM for keyword extraction...')
+			extracted_keyword_items = await self._ainvoke_structured(self.llm, ListKeywordItem, keyword_prompt)
+
+			if not isinstance(extracted_keyword_items, ListKeywordItem):
+				return extracted_keyword_items, None
+			return extracted_keyword_items, extracted_keyword_items.model_dump()
+
+		return await self._cached(_cache_key('keywords', self.llm, processed_cv_text), ListKeywordItem.model_validate, compute)
+
+	async def _generate_summary(self, processed_cv_text: str, job_description: Optional[str]) -> str:
+		"""Generates the CV summary, optionally in the light of the job description."""
+		self.logger.info('SummaryGeneratorNode: Starting CV summary generation')
+		summary_prompt = CV_SUMMARY_PROMPT.format(processed_cv_text=processed_cv_text, job_description=job_description)
+
+		async def compute():
+			self.logger.info('SummaryGeneratorNode: Invoking LLM for summary generation...')
+			async with self.llm_semaphore:
+				summary_response = await self.llm.ainvoke(summary_prompt)
+			input_tokens_sum, output_tokens_sum = self._track_usage(summary_response, summary_prompt)
+			self.logger.info(f'SummaryGeneratorNode: Summary generation tokens - input: {input_tokens_sum}, output: {output_tokens_sum}')
+			return summary_response.content, summary_response.content
+
+		cv_summary = await self._cached(_cache_key('summary', self.llm, processed_cv_text, job_description), str, compute)
+		self.logger.info(f'SummaryGeneratorNode: Generated summary length: {len(cv_summary)} characters')
+		return cv_summary
 
 	async def information_extractor_node(self, state: CVState) -> Dict[str, Any]:
 		"""Extracts detailed information from CV chunks using LLM directly in this node."""
-		self.logger.info(f'InformationExtractorNode: Starting LLM-based information extraction. state: {state.get("chunking_result")}')
+		self.logger.info('InformationExtractorNode: Starting LLM-based information extraction.')
 		processed_cv_text = state.get('processed_cv_text', '')
-		job_description = state.get('job_description', '')
 		chunking_result = state.get('chunking_result', LLMChunkingResult(chunks=[]))
 
 		self.logger.info(f'InformationExtractorNode: Processing CV text of length: {len(processed_cv_text)}')
 		self.logger.info(f'InformationExtractorNode: Found {len(chunking_result.chunks)} chunks from chunking')
 		self.logger.info(f'InformationExtractorNode: Chunking result type: {type(chunking_result)}')
-		self.logger.info(f'InformationExtractorNode: Raw chunking result: {chunking_result}')
+		self.logger.debug('InformationExtractorNode: Raw chunking result: %s', chunking_result)
 
 		# Initialize with default empty wrapper instances
 		extracted_data_update = {
@@ -289,161 +634,60 @@ Focus on semantic understanding and logical grouping, not keyword matching.
 			'certificate_items': ListCertificateItem(),
 			'interest_items': ListInterestItem(),
 			'other_extracted_data': {},
-			'extracted_keywords': ListKeywordItem(),  # Initialize with ListKeywordItem
-			'cv_summary': '',
 		}
 
-		current_messages = state.get('messages', [])
-
-		# Schema mapping for LLM-based extraction
-		type_to_schema_map = {
-			'personal_info': (PersonalInfoItem, 'personal_info_item'),
-			'education': (ListEducationItem, 'education_items'),
-			'work_experience': (ListWorkExperienceItem, 'work_experience_items'),
-			'skills': (ListSkillItem, 'skill_items'),
-			'projects': (ListProjectItem, 'project_items'),
-			'certificates': (ListCertificateItem, 'certificate_items'),
-			'interests': (ListInterestItem, 'interest_items'),
-		}
+		failed_steps: List[str] = []
+
+		type_to_schema_map = self.TYPE_TO_SCHEMA_MAP
 		self.logger.info(f'InformationExtractorNode: Schema mapping configured for {len(type_to_schema_map)} section types')
 
-		# Group chunks by section type
-		chunks_by_type = {}
+		# Group chunk contents by section type
+		chunks_by_type: Dict[str, List[str]] = defaultdict(list)
 		for chunk in chunking_result.chunks:
-			section_type = chunk.section
-			if section_type not in chunks_by_type:
-				chunks_by_type[section_type] = []
-			chunks_by_type[section_type].append(chunk)
+			chunks_by_type[chunk.section].append(chunk.chunk_content)
 
 		self.logger.info(f'InformationExtractorNode: Grouped chunks by type:')
-		for section_type, chunks in chunks_by_type.items():
-			self.logger.info(f'  - {section_type}: {len(chunks)} chunk(s), total chars: {sum(len(c.chunk_content) for c in chunks)}')
-
-		# Process each section type using LLM directly
-		for section_type, chunks in chunks_by_type.items():
-			self.logger.info(f"InformationExtractorNode: Processing section type '{section_type}'")
-
-			if section_type in type_to_schema_map:
-				schema, state_key = type_to_schema_map[section_type]
-
-				# Combine content from all chunks of this type
-				combined_content = '\n\n'.join([chunk.chunk_content for chunk in chunks])
-
-				self.logger.info(f'InformationExtractorNode: Processing {len(chunks)} chunks as {section_type}')
-				self.logger.info(f'InformationExtractorNode: Combined content length: {len(combined_content)} characters')
-				self.logger.info(f'InformationExtractorNode: Using schema: {schema.__name__} -> state key: {state_key}')
-
-				# Use LLM directly for extraction with structured output
-				extraction_prompt = f"""
-You are an expert CV data extractor. Extract structured information from the following {section_type} content.
-
-**Content to Extract From:**
-{combined_content}
-
-**Instructions:**
-1. Extract ALL relevant information from the content
-2. Structure the data according to the expected schema
-3. Be comprehensive and don't miss any details
-4. If information is missing, use null/empty values appropriately
-5. Ensure data is clean and properly formatted
-
-Focus on accuracy and completeness of extraction.
-"""
-
-				self.logger.info(f'InformationExtractorNode: Generating extraction prompt for {section_type}')
-				input_tokens = count_tokens(extraction_prompt, 'gemini')
-				self.token_tracker.add_input_tokens(input_tokens)
-				self.logger.info(f'InformationExtractorNode: Input tokens for {section_type}: {input_tokens}')
+		for section_type, contents in chunks_by_type.items():
+			self.logger.info(f'  - {section_type}: {len(contents)} chunk(s), total chars: {sum(map(len, contents))}')
 
-				structured_llm = self.llm.with_structured_output(schema)
-
-				try:
-					self.logger.info(f'InformationExtractorNode: Invoking LLM for {section_type} extraction...')
-					extracted_items = await structured_llm.ainvoke(extraction_prompt)
-					output_tokens = count_tokens(str(extracted_items), 'gemini')
-					self.token_tracker.add_output_tokens(output_tokens)
-
-					self.logger.info(f'InformationExtractorNode: LLM extraction successful for {section_type}')
-					self.logger.info(f'InformationExtractorNode: Output tokens for {section_type}: {output_tokens}')
-					self.logger.info(f'InformationExtractorNode: Extracted items for {section_type}: {extracted_items}')
-
-					if state_key == 'personal_info_item':
-						extracted_data_update[state_key] = extracted_items
-						self.logger.info(f'InformationExtractorNode: Set personal info item: {extracted_data_update[state_key]}')
-					else:
-						# For list types, assign the whole wrapper object
-						extracted_data_update[state_key] = extracted_items
-						items_count = len(extracted_items.items) if hasattr(extracted_items, 'items') else 0
-						self.logger.info(f'InformationExtractorNode: Set {state_key} with {items_count} items')
-						self.logger.info(f'InformationExtractorNode: {state_key} content: {extracted_data_update[state_key]}')
-
-					current_messages.append(AIMessage(content=f'LLM extracted {section_type} from {len(chunks)} chunks'))
-					self.logger.info(f'InformationExtractorNode: Added success message for {section_type}')
-
-				except Exception as e:
-					self.logger.error(f'InformationExtractorNode: ERROR extracting {section_type}: {e}')
-					self.logger.error(f'InformationExtractorNode: Exception type: {type(e).__name__}')
-					current_messages.append(AIMessage(content=f'Error extracting {section_type}: {e}'))
-
-			else:
+		# Sections without a schema are only noted as other data
+		for section_type in chunks_by_type:
+			if section_type not in type_to_schema_map:
 				self.logger.info(f"InformationExtractorNode: Section type '{section_type}' not in schema mapping")
 				self.logger.info(f'InformationExtractorNode: Available schema types: {list(type_to_schema_map.keys())}')
 				self.logger.info(f"InformationExtractorNode: Storing '{section_type}' as other data")
-				current_messages.append(AIMessage(content=f"Section type '{section_type}' noted as other data."))
 
-		# --- Keyword Extraction ---
-		self.logger.info('InformationExtractorNode: Starting keyword extraction phase')
-		keyword_prompt = EXTRACT_KEYWORDS_PROMPT.format(processed_cv_text=processed_cv_text)
-		input_tokens_keywords = count_tokens(keyword_prompt, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens_keywords)
-		self.logger.info(f'InformationExtractorNode: Keyword extraction input tokens: {input_tokens_keywords}')
-
-		structured_llm_keywords = self.llm.with_structured_output(ListKeywordItem)
-		try:
-			self.logger.info('InformationExtractorNode: Invoking LLM for keyword extraction...')
-			extracted_keyword_items = await structured_llm_keywords.ainvoke(keyword_prompt)
-
-			if isinstance(extracted_keyword_items, ListKeywordItem):
-				extracted_data_update['extracted_keywords'] = extracted_keyword_items
-				output_tokens_keywords = count_tokens(str(extracted_keyword_items), 'gemini')
-				self.token_tracker.add_output_tokens(output_tokens_keywords)
-				self.logger.info(f'InformationExtractorNode: Keyword extraction successful')
-				self.logger.info(f'InformationExtractorNode: Keyword extraction output tokens: {output_tokens_keywords}')
-				self.logger.info(f'InformationExtractorNode: Extracted {len(extracted_keyword_items.items)} keywords: {extracted_keyword_items.items}')
-				current_messages.append(AIMessage(content=f'Extracted {len(extracted_keyword_items.items)} keywords.'))
+		# Extract all mapped sections with one merged LLM call per model instead of one call per section
+		section_jobs = [(section_type, '\n\n'.join(contents)) for section_type, contents in chunks_by_type.items() if section_type in type_to_schema_map]
+		section_results = await self._extract_sections(section_jobs)
+
+		for section_type, _ in section_jobs:
+			extracted_items = section_results.get(section_type)
+			schema, state_key = type_to_schema_map[section_type]
+
+			if isinstance(extracted_items, Exception):
+				self.logger.error(f'InformationExtractorNode: ERROR extracting {section_type}: {extracted_items}')
+				self.logger.error(f'InformationExtractorNode: Exception type: {type(extracted_items).__name__}')
+				failed_steps.append(f'section:{section_type}')
+				continue
+
+			# An unparseable reply or a section the merged call left out keeps the empty default and marks the run degraded
+			if not isinstance(extracted_items, schema):
+				self.logger.error(f'InformationExtractorNode: No {schema.__name__} extracted for {section_type} (got {type(extracted_items).__name__})')
+				failed_steps.append(f'section:{section_type}')
+				continue
+
+			if state_key == 'personal_info_item':
+				extracted_data_update[state_key] = extracted_items
+				self.logger.debug('InformationExtractorNode: Set personal info item: %s', extracted_data_update[state_key])
 			else:
-				self.logger.error(f'InformationExtractorNode: ERROR - Keyword extraction returned unexpected type: {type(extracted_keyword_items)}')
-				self.logger.error(f'InformationExtractorNode: Expected ListKeywordItem, got: {extracted_keyword_items}')
-				current_messages.append(AIMessage(content='Keyword extraction failed to return expected type.'))
-		except Exception as e:
-			self.logger.error(f'InformationExtractorNode: ERROR during keyword extraction: {e}')
-			self.logger.error(f'InformationExtractorNode: Keyword extraction exception type: {type(e).__name__}')
-			current_messages.append(AIMessage(content=f'Error during keyword extraction: {e}'))
+				# For list types, assign the whole wrapper object
+				extracted_data_update[state_key] = extracted_items
+				items_count = len(extracted_items.items)
+				self.logger.info(f'InformationExtractorNode: Set {state_key} with {items_count} items')
+				self.logger.debug('InformationExtractorNode: %s content: %s', state_key, extracted_data_update[state_key])
 
-		# --- CV Summary Generation ---
-		self.logger.info('InformationExtractorNode: Starting CV summary generation')
-		summary_prompt = CV_SUMMARY_PROMPT.format(processed_cv_text=processed_cv_text, job_description=job_description)
-		input_tokens_sum = count_tokens(summary_prompt, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens_sum)
-		self.logger.info(f'InformationExtractorNode: Summary generation input tokens: {input_tokens_sum}')
-
-		try:
-			self.logger.info('InformationExtractorNode: Invoking LLM for summary generation...')
-			summary_response = await self.llm.ainvoke(summary_prompt)
-			extracted_data_update['cv_summary'] = summary_response.content
-			output_tokens_sum = count_tokens(extracted_data_update['cv_summary'], 'gemini')
-			self.token_tracker.add_output_tokens(output_tokens_sum)
-			self.logger.info(f'InformationExtractorNode: Summary generation successful')
-			self.logger.info(f'InformationExtractorNode: Summary generation output tokens: {output_tokens_sum}')
-			self.logger.info(f'InformationExtractorNode: Generated summary length: {len(extracted_data_update["cv_summary"])} characters')
-			self.logger.info(f'InformationExtractorNode: Summary preview: {extracted_data_update["cv_summary"][:200]}...')
-			current_messages.append(AIMessage(content=f'Generated CV summary.'))
-		except Exception as e:
-			self.logger.error(f'InformationExtractorNode: ERROR during summary generation: {e}')
-			self.logger.error(f'InformationExtractorNode: Summary generation exception type: {type(e).__name__}')
-			extracted_data_update['cv_summary'] = f'Error generating summary: {str(e)}'
-
-		extracted_data_update['messages'] = current_messages
+			self.logger.info(f'InformationExtractorNode: LLM extracted {section_type} from {len(chunks_by_type[section_type])} chunks')
 
 		# Final summary of extraction results
 		self.logger.info('InformationExtractorNode: Information extraction phase complete')
@@ -456,13 +700,94 @@ Focus on accuracy and completeness of extraction.
 		self.logger.info(f'  - Project items: {len(extracted_data_update["project_items"].items) if hasattr(extracted_data_update["project_items"], "items") else 0}')
 		self.logger.info(f'  - Certificate items: {len(extracted_data_update["certificate_items"].items) if hasattr(extracted_data_update["certificate_items"], "items") else 0}')
 		self.logger.info(f'  - Interest items: {len(extracted_data_update["interest_items"].items) if hasattr(extracted_data_update["interest_items"], "items") else 0}')
-		self.logger.info(f'  - Keywords: {len(extracted_data_update["extracted_keywords"].items) if hasattr(extracted_data_update["extracted_keywords"], "items") else 0}')
-		self.logger.info(f'  - Summary length: {len(extracted_data_update["cv_summary"])} chars')
 
+		extracted_data_update['failed_steps'] = failed_steps
 		return extracted_data_update
 
+	async def keyword_extractor_node(self, state: CVState) -> Dict[str, Any]:
+		"""Extracts general keywords; runs in parallel with chunking and section extraction."""
+		processed_cv_text = state.get('processed_cv_text') or ''
+		if _is_too_short(processed_cv_text):
+			self.logger.warning('KeywordExtractorNode: Processed CV text too short, skipping keyword extraction.')
+			return {'extracted_keywords': ListKeywordItem()}
+
+		try:
+			keyword_result = await self._extract_keywords(processed_cv_text)
+		except Exception as e:
+			self.logger.error(f'KeywordExtractorNode: ERROR during keyword extraction: {e}')
+			self.logger.error(f'KeywordExtractorNode: Keyword extraction exception type: {type(e).__name__}')
+			return {'extracted_keywords': ListKeywordItem(), 'failed_steps': ['keywords']}
+
+		if not isinstance(keyword_result, ListKeywordItem):
+			self.logger.error(f'KeywordExtractorNode: ERROR - Keyword extraction returned unexpected type: {type(keyword_result)}')
+			self.logger.error(f'KeywordExtractorNode: Expected ListKeywordItem, got: {keyword_result}')
+			return {'extracted_keywords': ListKeywordItem(), 'failed_steps': ['keywords']}
+
+		self.logger.info(f'KeywordExtractorNode: Extracted {len(keyword_result.items)} keywords')
+		self.logger.debug('KeywordExtractorNode: Keywords: %s', keyword_result.items)
+		return {'extracted_keywords': keyword_result}
+
+	async def summary_generator_node(self, state: CVState) -> Dict[str, Any]:
+		"""Generates the CV summary; runs in parallel with chunking and section extraction."""
+		processed_cv_text = state.get('processed_cv_text') or ''
+		if _is_too_short(processed_cv_text):
+			self.logger.warning('SummaryGeneratorNode: Processed CV text too short, skipping summary generation.')
+			return {'cv_summary': ''}
+
+		try:
+			cv_summary = await self._generate_summary(processed_cv_text, state.get('job_description', ''))
+		except Exception as e:
+			self.logger.error(f'SummaryGeneratorNode: ERROR during summary generation: {e}')
+			self.logger.error(f'SummaryGeneratorNode: Summary generation exception type: {type(e).__name__}')
+			return {'cv_summary': f'Error generating summary: {str(e)}', 'failed_steps': ['summary']}
+
+		return {'cv_summary': cv_summary}
+
+	async def fused_extractor_node(self, state: CVState) -> Dict[str, Any]:
+		"""Extracts all sections, keywords and the summary in one structured call; leaves the state untouched on failure."""
+		processed_cv_text = state.get('processed_cv_text') or ''
+		if _is_too_short(processed_cv_text):
+			# An empty summary also routes past the per-step fallback, which would skip the same way
+			self.logger.warning('FusedExtractorNode: Processed CV text too short, skipping extraction.')
+			return {'extracted_keywords': ListKeywordItem(), 'cv_summary': ''}
+
+		job_description = state.get('job_description') or ''
+		prompt = [
+			SystemMessage(content=GENERAL_EXTRACTION_SYSTEM_PROMPT),
+			HumanMessage(content=FUSED_EXTRACTION_PROMPT.format(processed_cv_text=processed_cv_text, job_description=job_description)),
+		]
+
+		async def compute():
+			self.logger.info('FusedExtractorNode: Invoking LLM for fused extraction...')
+			fused = await self._ainvoke_structured(self.llm, FusedCVExtraction, prompt)
+			return fused, fused.model_dump() if isinstance(fused, FusedCVExtraction) else None
+
+		try:
+			fused = await self._cached(_cache_key('fused', self.llm, processed_cv_text, job_description), FusedCVExtraction.model_validate, compute)
+		except Exception as e:
+			self.logger.warning(f'FusedExtractorNode: Fused extraction failed, falling back to per-step extraction: {e}')
+			return {}
+
+		if not isinstance(fused, FusedCVExtraction):
+			self.logger.warning(f'FusedExtractorNode: Unexpected result type {type(fused)}, falling back to per-step extraction')
+			return {}
+
+		self.logger.info('FusedExtractorNode: Fused extraction successful')
+		return {field_name: getattr(fused, field_name) for field_name in FusedCVExtraction.model_fields}
+
+	@staticmethod
+	def _route_after_fused(state: CVState) -> Any:
+		"""Continues to inference after a successful fused extraction, otherwise fans out to the per-step branches."""
+		if state.get('cv_summary') is not None:
+			return 'CharacteristicInference'
+		return ['LLMChunkDecision', 'KeywordExtractor', 'SummaryGenerator']
+
 	async def characteristic_inference_node(self, state: CVState) -> Dict[str, Any]:
 		"""Infers candidate characteristics based on extracted CV data."""
+		if _is_too_short(state.get('processed_cv_text')):
+			self.logger.warning('CharacteristicInferenceNode: Processed CV text too short, skipping inference.')
+			return {'inferred_characteristics': ListInferredItem()}
+
 		self.logger.info('CharacteristicInferenceNode: Inferring characteristics.')
 
 		# Prepare data for the prompt, accessing .items from wrapper types if necessary
@@ -473,46 +798,40 @@ Focus on accuracy and completeness of extraction.
 		certificate_items = state.get('certificate_items')
 		interest_items = state.get('interest_items')
 
+		keyword_items = state.get('extracted_keywords')
+
+		# Compact JSON instead of Python reprs of the Pydantic items keeps the prompt small
 		inference_prompt_filled = INFERENCE_PROMPT.format(
-			personal_info=state.get('personal_info_item'),
-			education_history=(education_history_items.items if education_history_items else []),
-			work_experience=(work_experience_items.items if work_experience_items else []),
-			skills=skill_items.items if skill_items else [],
-			projects=project_items.items if project_items else [],
-			certificates=certificate_items.items if certificate_items else [],
-			interests=interest_items.items if interest_items else [],
-			other_sections_data=state.get('other_extracted_data'),
+			personal_info=_compact_json(state.get('personal_info_item')),
+			education_history=_compact_json(education_history_items.items if education_history_items else []),
+			work_experience=_compact_json(work_experience_items.items if work_experience_items else []),
+			skills=_compact_json(skill_items.items if skill_items else []),
+			projects=_compact_json(project_items.items if project_items else []),
+			certificates=_compact_json(certificate_items.items if certificate_items else []),
+			interests=_compact_json(interest_items.items if interest_items else []),
+			other_sections_data=_compact_json(state.get('other_extracted_data') or {}),
 			cv_summary=state.get('cv_summary'),
-			extracted_keywords=state.get('extracted_keywords'),
+			extracted_keywords=_compact_json([item.keyword for item in keyword_items.items] if keyword_items else []),
 		)
-		self.logger.info(f'Filled inference prompt: {inference_prompt_filled}')
+		self.logger.debug('Filled inference prompt length: %d', len(inference_prompt_filled))
 		system_prompt_with_schema = f'{INFERENCE_SYSTEM_PROMPT}\n\nThe output MUST be structured according to the following Pydantic schema'
 
-		full_prompt_for_tokens = system_prompt_with_schema + '\n' + inference_prompt_filled
-		input_tokens = count_tokens(full_prompt_for_tokens, 'gemini')
-		self.token_tracker.add_input_tokens(input_tokens)
-
-		structured_llm = self.llm.with_structured_output(ListInferredItem)
 		try:
-			inferred_characteristics_response = await structured_llm.ainvoke(  # type: ignore
+			# The response is already ListInferredItem, no need to access .items here for assignment to state
+			inferred_characteristics = await self._ainvoke_structured(
+				self.llm,
+				ListInferredItem,
 				[
 					SystemMessage(content=system_prompt_with_schema),
 					HumanMessage(content=inference_prompt_filled),
-				]
+				],
 			)
-			# The response is already ListInferredItem, no need to access .items here for assignment to state
-			inferred_characteristics = inferred_characteristics_response
-			output_tokens = count_tokens(str(inferred_characteristics_response), 'gemini')  # Count tokens from the response model
-			self.token_tracker.add_output_tokens(output_tokens)
 			self.logger.info(f'CharacteristicInferenceNode: Inferred {len(inferred_characteristics.items) if inferred_characteristics else 0} characteristics.')
 		except Exception as e:
 			self.logger.error(f'CharacteristicInferenceNode: Error inferring characteristics: {e}')
-			inferred_characteristics = []
+			return {'inferred_characteristics': [], 'failed_steps': ['inference']}
 
-		return {
-			'inferred_characteristics': inferred_characteristics,
-			'messages': state.get('messages', []) + [AIMessage(content=f'Inferred {len(inferred_characteristics.items) if inferred_characteristics else 0} characteristics.')],
-		}
+		return {'inferred_characteristics': inferred_characteristics}
 
 	async def output_aggregator_node(self, state: CVState) -> Dict[str, Any]:
 		"""Aggregates all data into the final CVAnalysisResult model."""
@@ -534,24 +853,10 @@ Focus on accuracy and completeness of extraction.
 			cv_summary=state.get('cv_summary'),
 			extracted_keywords=state.get('extracted_keywords', []),
 			inferred_characteristics=state.get('inferred_characteristics'),  # Pass the wrapper object directly
-			llm_token_usage={
-				'input_tokens': self.token_tracker.input_tokens,
-				'output_tokens': self.token_tracker.output_tokens,
-				'total_tokens': self.token_tracker.total_tokens,
-				'price_usd': round(
-					calculate_price(
-						self.token_tracker.input_tokens,
-						self.token_tracker.output_tokens,
-					),
-					6,
-				),
-			},
+			llm_token_usage=self.token_tracker.usage(),
 		)
-		self.logger.info('OutputAggregatorNode: Final result aggregated.')
-		return {
-			'final_analysis_result': final_result,
-			'messages': state.get('messages', []) + [AIMessage(content='CV analysis complete. Final result aggregated.')],
-		}
+		self.logger.info(f'OutputAggregatorNode: Final result aggregated ({self.token_tracker.retries} structured output retries).')
+		return {'final_analysis_result': final_result}
 
 	def _build_graph(self) -> StateGraph:
 		"""Constructs the LangGraph StateGraph for CV processing."""
@@ -563,19 +868,40 @@ Focus on accuracy and completeness of extraction.
 		workflow.add_node('CVParser', self.cv_parser_node)
 		workflow.add_node('LLMChunkDecision', self.llm_chunk_decision_node)
 		workflow.add_node('InformationExtractor', self.information_extractor_node)
+		workflow.add_node('KeywordExtractor', self.keyword_extractor_node)
+		workflow.add_node('SummaryGenerator', self.summary_generator_node)
 		workflow.add_node('CharacteristicInference', self.characteristic_inference_node)
 		workflow.add_node('OutputAggregator', self.output_aggregator_node)
 
 		# Define edges for the workflow
 		workflow.add_edge(START, 'InputHandler')
-		workflow.add_edge('InputHandler', 'CVParser')
-		workflow.add_edge('CVParser', 'LLMChunkDecision')
+		# Rejected input already carries its final result, so the run ends before any LLM call
+		workflow.add_conditional_edges(
+			'InputHandler',
+			lambda state: END if state.get('final_analysis_result') is not None else 'CVParser',
+			['CVParser', END],
+		)
+		if self.fused_extraction:
+			# One call fills sections, keywords and summary; the per-step branches only run if it fails
+			workflow.add_node('FusedExtractor', self.fused_extractor_node)
+			workflow.add_edge('CVParser', 'FusedExtractor')
+			workflow.add_conditional_edges(
+				'FusedExtractor',
+				self._route_after_fused,
+				['CharacteristicInference', 'LLMChunkDecision', 'KeywordExtractor', 'SummaryGenerator'],
+			)
+		else:
+			# Keywords and summary only need the cleaned text, so they fan out from the parser
+			# alongside chunking and join section extraction before inference
+			workflow.add_edge('CVParser', 'LLMChunkDecision')
+			workflow.add_edge('CVParser', 'KeywordExtractor')
+			workflow.add_edge('CVParser', 'SummaryGenerator')
 		workflow.add_edge('LLMChunkDecision', 'InformationExtractor')
-		workflow.add_edge('InformationExtractor', 'CharacteristicInference')
+		workflow.add_edge(['InformationExtractor', 'KeywordExtractor', 'SummaryGenerator'], 'CharacteristicInference')
 		workflow.add_edge('CharacteristicInference', 'OutputAggregator')  # Added edge
 		workflow.add_edge('OutputAggregator', END)
 
-		return workflow.compile(checkpointer=self.memory)
+		return workflow.compile(checkpointer=self.checkpointer)
 
 	async def align_with_jd(self, result: CVAnalysisResult, job_description: str) -> Optional[str]:
 		try:
@@ -584,7 +910,9 @@ Focus on accuracy and completeness of extraction.
 				processed_cv_text=result.processed_cv_text or "",
 				job_description=job_description,
 			)
-			response = await self.llm.ainvoke(prompt)
+			async with self.llm_semaphore:
+				response = await self.llm.ainvoke(prompt)
+			self._track_usage(response, prompt)
 			return response.content
 		except Exception as e:
 			self.logger.error(f"JD alignment failed: {str(e)}")
@@ -596,14 +924,14 @@ Focus on accuracy and completeness of extraction.
 		Returns a CVAnalysisResult on success, or None on error.
 		"""
 		self.logger.info(f'Starting CV analysis for content of length: {len(cv_content)}')
-		self.token_tracker.reset()
+		_current_token_tracker.set(TokenTracker())
+		_current_llm_slot.set(next(self._next_llm_slot))
 
 		thread_id = str(uuid.uuid4())
 		config = {'configurable': {'thread_id': thread_id}}
 
 		# Initialize state with wrapper types where appropriate
 		initial_state_data = {
-			'messages': [],
 			'raw_cv_content': cv_content,
 			'processed_cv_text': None,
 			'job_description': job_description,  # ✅ Add this
@@ -620,6 +948,7 @@ Focus on accuracy and completeness of extraction.
 			'cv_summary': None,
 			'inferred_characteristics': ListInferredItem(),
 			'token_usage': None,
+			'failed_steps': [],
 			'final_analysis_result': None,
 		}
 		initial_state = CVState(**initial_state_data)
@@ -630,15 +959,32 @@ Focus on accuracy and completeness of extraction.
 				self.logger.info('CV analysis completed successfully.')
 
 				final_result = final_state_result['final_analysis_result']
-
-				# JD Alignment: optional
-				if job_description:
-					self.logger.debug(f"CV Summary: {final_result.cv_summary}")
-					self.logger.debug(f"Job Description: {job_description[:100]}...")  # to avoid flooding logs
-					final_result.alignment_with_jd = await self.align_with_jd(final_result, job_description)
+				failed_steps = list(final_state_result.get('failed_steps') or [])
+
+				# JD Alignment: optional, pointless for input rejected before parsing, and already present on a cache hit
+				if job_description and final_result.processed_cv_text:
+					if final_result.alignment_with_jd is None:
+						self.logger.debug(f"CV Summary: {final_result.cv_summary}")
+						self.logger.debug(f"Job Description: {job_description[:100]}...")  # to avoid flooding logs
+						final_result.alignment_with_jd = await self.align_with_jd(final_result, job_description)
+						# The aggregator snapshotted usage before alignment ran
+						final_result.llm_token_usage = self.token_tracker.usage()
+						if final_result.alignment_with_jd is None:
+							failed_steps.append('alignment')
 				else:
 					final_result.alignment_with_jd = None
 
+				# Only a run that went through the pipeline has processed text in the graph state;
+				# rejected input and cache hits end at the input handler. A degraded run is not cached,
+				# so a transient provider error is not replayed on retries of the same CV
+				if failed_steps:
+					self.logger.warning(f'Not caching analysis result, failed steps: {failed_steps}')
+				elif final_state_result.get('processed_cv_text'):
+					await _cache_set(
+						self._result_cache_key(cv_content, job_description),
+						final_result.model_dump(mode='json', exclude={'raw_cv_content'}),
+					)
+
 				return final_result
 			else:
 				self.logger.error('CV analysis finished but no final_analysis_result found in state.')
@@ -649,17 +995,6 @@ Focus on accuracy and completeness of extraction.
 				raw_cv_content=cv_content,
 				processed_cv_text=initial_state.get('processed_cv_text'),
 				cv_summary=f'Error during analysis: {str(e)}',
-				llm_token_usage={
-					'input_tokens': self.token_tracker.input_tokens,
-					'output_tokens': self.token_tracker.output_tokens,
-					'total_tokens': self.token_tracker.total_tokens,
-					'price_usd': round(
-						calculate_price(
-							self.token_tracker.input_tokens,
-							self.token_tracker.output_tokens,
-						),
-						6,
-					),
-				},
+				llm_token_usage=self.token_tracker.usage(),
 			)
 			return error_result
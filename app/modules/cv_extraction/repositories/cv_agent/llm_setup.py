@@ -1,9 +1,15 @@
+from functools import lru_cache
+
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from app.core.config import CV_EXTRACTION_MODEL
+
 
-def initialize_llm(api_key: str):
+# One client per (key, model) for the whole process, so every workflow reuses its connection pool
+@lru_cache(maxsize=None)
+def initialize_llm(api_key: str, model: str = CV_EXTRACTION_MODEL):
 	return ChatGoogleGenerativeAI(
-		model='gemini-2.0-flash',
+		model=model,
 		api_key=api_key,
 		temperature=0.5,
 	)
@@ -18,16 +18,40 @@ CV Content:
 {raw_cv_content}
 """
 
-# --- Section Identification Prompt ---
-SECTION_IDENTIFICATION_PROMPT = """
-Analyze the following processed CV text and identify the main sections.
-Return a list of section titles found in the CV. Be flexible and include any industry-specific or uncommon sections.
-Examples: Personal Information, Contact, Summary, Objective, Education, Work Experience, Experience, Skills, Projects, Certifications, Awards, Publications, References, Interests, Hobbies, Languages, Volunteer Work, Industry-Specific Sections (e.g., Research, Patents, Clinical Experience).
+# --- LLM Chunking and Classification Prompts ---
+# Static instructions go in the system message and the CV last, so the prefix is identical across CVs
+LLM_CHUNKING_SYSTEM_PROMPT = """
+You are an expert CV analyzer. Read the CV content provided by the user and intelligently divide it into logical chunks, where each chunk represents a coherent section of the CV.
+
+**Section Types Available:**
+- personal_info: Personal details, contact information, profile, summary, bio, introduction
+- education: Academic background, degrees, schools, universities, qualifications, studies  
+- work_experience: Employment history, professional experience, career, jobs, positions
+- skills: Technical skills, competencies, abilities, expertise, languages, technologies
+- projects: Personal projects, portfolio, case studies, achievements, works
+- certificates: Certifications, licenses, courses, training, credentials, workshops
+- interests: Hobbies, activities, personal interests, volunteering, recreational activities
+- other: Any content that doesn't fit the above categories
+
+**Instructions:**
+1. Analyze the content semantically and divide into logical chunks
+2. Each chunk should contain related information that belongs to the same section type
+3. Don't break up coherent information across multiple chunks
+4. Classify each chunk into the most appropriate section type
+5. Ensure personal information is captured completely in one chunk
+6. Make sure no important information is lost
+
+**Expected Output Format:**
+Return a list of chunks where each chunk has:
+- chunk_content: The actual text content
+- section: The classified section type
+
+Focus on semantic understanding and logical grouping, not keyword matching.
+"""
 
-Processed CV Text:
+LLM_CHUNKING_USER_PROMPT = """
+**CV Content:**
 {processed_cv_text}
-
-Identified Sections (should be a list of strings):
 """
 
 # --- General Extraction System Prompt ---
@@ -40,14 +64,50 @@ and structure it according to the provided Pydantic schema.
 - Be ready to handle and extract new or industry-specific sections if present.
 """
 
-# --- Section Extraction Prompt Template ---
-EXTRACT_SECTION_PROMPT_TEMPLATE = """
-From the following CV text, extract all information relevant to the '{section_title}' section.
-- Use the provided schema for structuring the output.
-- If the section is industry-specific or uncommon, extract as much structured information as possible.
+# --- Chunked Section Extraction Prompt Template ---
+EXTRACT_CHUNKED_SECTION_PROMPT = """
+You are an expert CV data extractor. Extract structured information from the CV section content given at the end.
+
+**Instructions:**
+1. Extract ALL relevant information from the content
+2. Structure the data according to the expected schema
+3. Be comprehensive and don't miss any details
+4. If information is missing, use null/empty values appropriately
+5. Ensure data is clean and properly formatted
+
+Focus on accuracy and completeness of extraction.
+
+**Section Type:** {section_type}
+
+**Content to Extract From:**
+{combined_content}
+"""
+
+# --- Merged Section Extraction Prompt Template ---
+EXTRACT_SECTIONS_PROMPT_TEMPLATE = """
+The following CV content is grouped by section type, each group under a '### <section_type>' heading.
+Extract every group into the field of the same name in the provided schema.
+- Only use the content of a group for its own field.
+- Extract ALL relevant information and don't miss any details.
+- If information is missing, use null/empty values appropriately.
+
+{sections_content}
+"""
+
+# --- Fused Extraction Prompt ---
+FUSED_EXTRACTION_PROMPT = """
+From the processed CV text below, fill every field of the provided schema in one pass:
+- Extract each section (personal information, education, work experience, skills, projects, certificates, interests) into its own field.
+- extracted_keywords: the key skills, technologies, roles, concepts and industry-specific terms mentioned in the CV.
+- cv_summary: a concise professional summary of the candidate in 3-5 sentences, highlighting key experiences, skills and
+  career objectives; if a job description is given, focus on overlapping experiences, skills and potential gaps.
+- If a section is not present, leave its field empty.
+
+Processed CV Text:
+{processed_cv_text}
 
-CV Text (or relevant portion):
-{cv_text_portion}
+Job Description:
+{job_description}
 """
 
 # --- Keyword Extraction Prompt ---
@@ -101,7 +161,8 @@ Structure your output according to the provided schema.
 
 # --- Characteristic Inference Prompt ---
 INFERENCE_PROMPT = """
-Here is the structured data extracted from the CV:
+Based on the structured data extracted from the CV below, please infer characteristics about the candidate as per the system prompt and the required output schema.
+- If the CV includes industry-specific sections or data, include relevant inferences.
 
 Personal Information: {personal_info}
 Education History: {education_history}
@@ -113,9 +174,6 @@ Interests: {interests}
 Other Sections: {other_sections_data}
 CV Summary: {cv_summary}
 Keywords: {extracted_keywords}
-
-Based on all this information, please infer characteristics about the candidate as per the system prompt and the required output schema.
-- If the CV includes industry-specific sections or data, include relevant inferences.
 """
 
 # --- Extensibility Note ---
@@ -1,6 +1,4 @@
-import json
-import re
-from typing import Dict
+from functools import lru_cache
 
 import tiktoken
 
@@ -10,6 +8,7 @@ from app.core.config import (
 	INPUT_PRICE_PER_MILLION,
 	OUTPUT_PRICE_PER_MILLION,
 )
+from app.modules.cv_extraction.repositories.cv_agent.agent_schema import TokenUsage
 
 
 def calculate_price(input_tokens: int, output_tokens: int, context_tokens: int = 0) -> float:
@@ -29,31 +28,10 @@ def calculate_price(input_tokens: int, output_tokens: int, context_tokens: int =
 	return input_price + output_price + context_price
 
 
-def parse_json_from_response(response: str) -> Dict:
-	"""_summary_
-
-	Args:
-	    response (str): _description_
-
-	Returns:
-	    Dict: _description_
-	"""
-
-	try:
-		parsed_response = json.loads(response)
-	except json.JSONDecodeError:
-		try:
-			new_response = response.split('```')[1][5:]
-			parsed_response = json.loads(new_response)
-		except json.JSONDecodeError:
-			pattern = r'(json)\s*({.*})'
-			match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
-
-			if match:
-				parsed_response = json.loads(match.group(2))
-			else:
-				parsed_response = {}
-	return parsed_response
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+	"""Return the tiktoken encoding for a model, resolving it only once per model."""
+	return tiktoken.encoding_for_model(model)
 
 
 def count_tokens(text: str, model: str = 'gpt-4') -> int:
@@ -69,20 +47,22 @@ def count_tokens(text: str, model: str = 'gpt-4') -> int:
 	if not text:
 		return 0
 
+	model_name = model.lower()
+
 	# Handle Gemini models
-	if 'gemini' in model.lower():
+	if 'gemini' in model_name:
 		# Gemini approximates tokens as ~4 characters per token
 		return len(text) // 4
 
 	# Handle Google/Vertex AI models through LiteLLM
-	elif model.lower().startswith(('google/', 'vertex_ai/')):
+	elif model_name.startswith(('google/', 'vertex_ai/')):
 		# Use same approximation for Google models
 		return len(text) // 4
 
 	# Handle OpenAI models with tiktoken
 	else:
 		try:
-			encoding = tiktoken.encoding_for_model(model)
+			encoding = _get_encoding(model)
 			return len(encoding.encode(text))
 		except (KeyError, ValueError, ImportError):
 			# Fallback for unknown models
@@ -95,6 +75,7 @@ class TokenTracker:
 		self.input_tokens = 0
 		self.output_tokens = 0
 		self.context_tokens = 0
+		self.retries = 0
 
 	@property
 	def total_tokens(self):
@@ -109,7 +90,20 @@ class TokenTracker:
 	def add_context_tokens(self, tokens: int):
 		self.context_tokens += tokens
 
+	def add_retry(self):
+		self.retries += 1
+
 	def reset(self):
 		self.input_tokens = 0
 		self.output_tokens = 0
 		self.context_tokens = 0
+		self.retries = 0
+
+	def usage(self) -> TokenUsage:
+		"""Snapshot the counters as the llm_token_usage payload."""
+		return TokenUsage(
+			input_tokens=self.input_tokens,
+			output_tokens=self.output_tokens,
+			total_tokens=self.total_tokens,
+			price_usd=round(calculate_price(self.input_tokens, self.output_tokens), 6),
+		)
@@ -1,20 +1,51 @@
 import aiohttp
 import aiofiles
+import asyncio
 import uuid
 import os
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from fastapi import File, UploadFile
 import tempfile
 import shutil
 from typing import Optional
 from app.core.base_model import APIResponse
 from app.middleware.translation_manager import _
-from app.modules.cv_extraction.repositories.cv_agent import CVAnalyzer
+from app.modules.cv_extraction.repositories.cv_agent import get_cv_analyzer
+from app.modules.cv_extraction.repositories.cv_agent.cv_processor import MIN_CV_CHARS
 from app.modules.cv_extraction.repositories.cv_agent.ai_to_api_mapper import ai_to_cvbase
 from app.modules.cv_extraction.schemas.cv import ProcessCVRequest
-from app.utils.pdf import PDFToTextConverter
+from app.utils.pdf import extract_pdf_text
+
+# A PDF header must appear within the first 1024 bytes of the file
+_PDF_MAGIC = b'%PDF-'
+_PDF_HEADER_WINDOW = 1024
+
+# PDF parsing is CPU-bound; run it in sibling processes so it never stalls the event loop.
+# Created on first use with spawned workers, so importing this module never forks a threaded server
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _pdf_pool() -> ProcessPoolExecutor:
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn'))
+    return _PDF_POOL
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF worker processes; registered as an app shutdown handler."""
+    global _PDF_POOL
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+        _PDF_POOL = None
+
 
 class CVRepository:
+    # Shared across requests so CV downloads reuse keep-alive connections; created lazily on the running loop
+    _session: Optional[aiohttp.ClientSession] = None
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -29,20 +60,19 @@ class CVRepository:
             suffix = f".{file_extension}"
             async with aiofiles.tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
                 temp_path = tmp.name
-                contents = await file.read()
-                await tmp.write(contents)
-            self.logger.info(f"Saved uploaded file to {temp_path}")
+                # Copy in chunks so a large upload is never held in memory at once
+                while chunk := await file.read(1 << 20):
+                    await tmp.write(chunk)
+            self.logger.debug(f"Saved uploaded file to {temp_path}")
         except Exception as e:
             self.logger.error(f"Failed to save file: {e}")
             return APIResponse(error_code=1, message=_('failed_to_save_uploaded_file'), data=None)
 
         extracted_text = None
-        converter = None
 
         try:
             if file_extension == 'pdf':
-                converter = PDFToTextConverter(file_path=temp_path)
-                extracted_text = converter.extract_text()
+                extracted_text = await asyncio.get_running_loop().run_in_executor(_pdf_pool(), extract_pdf_text, temp_path)
                 self.logger.info(f"Extracted {len(extracted_text.get('text', ''))} characters from PDF")
             else:
                 return APIResponse(error_code=1, message=_('unsupported_cv_file_type'), data=None)
@@ -50,16 +80,17 @@ class CVRepository:
             self.logger.error(f"Extraction error: {e}")
             return APIResponse(error_code=1, message=_('error_extracting_cv_content'), data=None)
         finally:
-            if converter:
-                converter.close()
             if os.path.exists(temp_path):
                 os.remove(temp_path)
 
         if not extracted_text or not extracted_text.get('text'):
             return APIResponse(error_code=1, message=_('no_text_extracted'), data=None)
+        # Too little text to be a CV (e.g. a scanned PDF without a text layer): skip the LLM pipeline
+        if len(extracted_text['text'].strip()) < MIN_CV_CHARS:
+            return APIResponse(error_code=1, message=_('cv_content_too_short'), data=None)
 
         try:
-            cv_analyzer = CVAnalyzer()
+            cv_analyzer = get_cv_analyzer()
             ai_result = await cv_analyzer.analyze_cv_content(extracted_text['text'], job_description)
             if ai_result is None:
                 return APIResponse(error_code=1, message=_('error_analyzing_cv'), data=None)
@@ -86,27 +117,30 @@ class CVRepository:
         if not file_path:
             return APIResponse(error_code=1, message=_('failed_to_download_file'), data=None)
 
+        if not await self._is_pdf(file_path):
+            os.remove(file_path)
+            return APIResponse(error_code=1, message=_('unsupported_cv_file_type'), data=None)
+
         extracted_text = None
-        converter = None
 
         try:
-            converter = PDFToTextConverter(file_path=file_path)
-            extracted_text = converter.extract_text()
+            extracted_text = await asyncio.get_running_loop().run_in_executor(_pdf_pool(), extract_pdf_text, file_path)
             self.logger.info(f"Extracted {len(extracted_text.get('text', ''))} characters from PDF")
         except Exception as e:
             self.logger.error(f"Extraction failed: {e}")
             return APIResponse(error_code=1, message=_('error_extracting_cv_content'), data=None)
         finally:
-            if converter:
-                converter.close()
             if os.path.exists(file_path):
                 os.remove(file_path)
 
         if not extracted_text or not extracted_text.get('text'):
             return APIResponse(error_code=1, message=_('no_text_extracted'), data=None)
+        # Too little text to be a CV (e.g. a scanned PDF without a text layer): skip the LLM pipeline
+        if len(extracted_text['text'].strip()) < MIN_CV_CHARS:
+            return APIResponse(error_code=1, message=_('cv_content_too_short'), data=None)
 
         try:
-            cv_analyzer = CVAnalyzer()
+            cv_analyzer = get_cv_analyzer()
             ai_result = await cv_analyzer.analyze_cv_content(
                 extracted_text['text'], request.job_description
             )
@@ -135,16 +169,44 @@ class CVRepository:
         file_path = os.path.join(temp_dir, file_name)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, ssl=False) as response:
-                    if response.status == 200:
+            async with self._get_session().get(url, read_bufsize=256 * 1024) as response:
+                if response.status == 200:
+                    # Write the body as it arrives so a download never holds the whole PDF in memory;
+                    # a stream that breaks off (or is cancelled) must not leave a truncated file behind
+                    try:
                         async with aiofiles.open(file_path, 'wb') as f:
-                            await f.write(await response.read())
-                        self.logger.info(f"Downloaded CV to {file_path}")
-                        return file_path
-                    else:
-                        self.logger.error(f"Failed to download: HTTP {response.status}")
-                        return None
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                await f.write(chunk)
+                    except BaseException:
+                        if os.path.exists(file_path):
+                            os.remove(file_path)
+                        raise
+                    self.logger.debug(f"Downloaded CV to {file_path}")
+                    return file_path
+                else:
+                    self.logger.error(f"Failed to download: HTTP {response.status}")
+                    return None
         except Exception as e:
             self.logger.error(f"Download error: {e}")
             return None
+
+    @staticmethod
+    async def _is_pdf(file_path: str) -> bool:
+        """Check the PDF magic bytes before handing the file to the parser pool."""
+        async with aiofiles.open(file_path, 'rb') as f:
+            return _PDF_MAGIC in await f.read(_PDF_HEADER_WINDOW)
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=16, ssl=False, keepalive_timeout=75),
+            )
+        return cls._session
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared download session; registered as an app shutdown handler."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from datetime import date
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 
 from app.core.base_model import RequestSchema
 
@@ -16,8 +16,7 @@ class EducationEntry(BaseModel):
     end_year: Optional[int] = None
     description: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ExperienceEntry(BaseModel):
     title: str
@@ -26,16 +25,14 @@ class ExperienceEntry(BaseModel):
     end_date: Optional[date] = None
     description: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProjectEntry(BaseModel):
     title: str
     tech_stack: List[str]
     description: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CertificationEntry(BaseModel):
     name: str
@@ -43,8 +40,7 @@ class CertificationEntry(BaseModel):
     time_period: Optional[date] = None
     description: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Main schemas
 class CVBase(BaseModel):
@@ -66,20 +62,17 @@ class CVBase(BaseModel):
     # def clean_empty_str_fields(cls, v):
     #     return v or None  
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CVCreate(CVBase):
     uploaded_by: str
     source: str  
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CVResponse(CVBase):
     id: str
     created_at: date
     updated_at: date
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
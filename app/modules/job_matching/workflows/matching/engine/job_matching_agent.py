@@ -1,7 +1,11 @@
 import json
 import logging
 import asyncio
+import re
 import time
+import traceback
+import uuid
+from datetime import datetime
 from typing import Dict, Any, List
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
@@ -21,6 +25,10 @@ from app.modules.job_matching.workflows.matching.schemas.matching import (
 
 logger = logging.getLogger(__name__)
 
+# Repairs applied to malformed LLM JSON: unquoted keys, then unquoted string values
+UNQUOTED_KEY_PATTERN = re.compile(r'(\s*)(\w+)(\s*):')
+UNQUOTED_VALUE_PATTERN = re.compile(r':\s*([^",\{\}\[\]\d][^,\{\}\[\]]*[^",\{\}\[\]\s])\s*([,\}\]])')
+
 class JobMatchingAgent:
     """Agent xử lý job matching - nhận dữ liệu từ cv_extraction và sinh gợi ý"""
     
@@ -240,18 +248,13 @@ class JobMatchingAgent:
             json_str = json_str.rstrip(',')
             
             # Fix missing quotes around keys
-            import re
-            # Pattern to match unquoted keys
-            pattern = r'(\s*)(\w+)(\s*):'
-            json_str = re.sub(pattern, r'\1"\2"\3:', json_str)
+            json_str = UNQUOTED_KEY_PATTERN.sub(r'\1"\2"\3:', json_str)
             
             # Fix single quotes to double quotes
             json_str = json_str.replace("'", '"')
             
             # Fix missing quotes around string values
-            # Pattern to match unquoted string values
-            pattern = r':\s*([^",\{\}\[\]\d][^,\{\}\[\]]*[^",\{\}\[\]\s])\s*([,\}\]])'
-            json_str = re.sub(pattern, r': "\1"\2', json_str)
+            json_str = UNQUOTED_VALUE_PATTERN.sub(r': "\1"\2', json_str)
             
             logger.info(f"Fixed JSON string: {json_str}")
             return json_str
@@ -264,10 +267,6 @@ class JobMatchingAgent:
         logger.info("Starting job matching process")
         
         try:
-            # Import cần thiết
-            import uuid
-            from datetime import datetime
-            
             # Kiểm tra input và log chi tiết
             logger.info(f"JD Alignment: {jd_alignment}")
             logger.info(f"CV Analysis Result: {cv_analysis_result}")
@@ -363,7 +362,6 @@ class JobMatchingAgent:
             
         except Exception as e:
             logger.error(f"Error in job matching process: {e}")
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             
             # Return error result
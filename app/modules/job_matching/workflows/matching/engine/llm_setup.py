@@ -1,6 +1,10 @@
+from functools import lru_cache
+
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 
+# One client per API key for the whole process, so every agent reuses its connection pool
+@lru_cache(maxsize=None)
 def initialize_llm(api_key: str):
     return ChatGoogleGenerativeAI(
         model='gemini-2.0-flash',
@@ -10,4 +14,4 @@ def initialize_llm(api_key: str):
         request_timeout=30,
         max_retries=2,
         convert_system_message_to_human=True,
-    ) 
\ No newline at end of file
+    )
@@ -1,37 +1,30 @@
 # question_interview/memory/session_store.py
 
-import json
 from pathlib import Path
 import os
 
+import orjson
+
 SESSIONS_DIR = Path("app/modules/question_interview/memory/sessions")
 SESSIONS_DIR.mkdir(exist_ok=True)
 
 
-def save_session_state(session_id: str, state: dict):
-    session_file = SESSIONS_DIR / f"{session_id}.json"
-
-    # Convert Pydantic objects (e.g., Question) to dicts
-    def convert(obj):
-        if hasattr(obj, "model_dump"):
-            return obj.model_dump()
-        elif isinstance(obj, list):
-            return [convert(i) for i in obj]
-        elif isinstance(obj, dict):
-            return {k: convert(v) for k, v in obj.items()}
-        return obj
+def _default(obj):
+    # Pydantic objects (e.g., Question) are the only non-native values in the state
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-    cleaned_state = convert(state)
 
-    with open(session_file, "w", encoding="utf-8") as f:
-        json.dump(cleaned_state, f, ensure_ascii=False, indent=2)
+def save_session_state(session_id: str, state: dict):
+    session_file = SESSIONS_DIR / f"{session_id}.json"
+    session_file.write_bytes(orjson.dumps(state, default=_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 def load_session_state(session_id: str) -> dict:
     session_file = SESSIONS_DIR / f"{session_id}.json"
     if not session_file.exists():
         return {}
-    with open(session_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(session_file.read_bytes())
 
 def delete_session_state(session_id: str):
     file_path = os.path.join(SESSIONS_DIR, f"{session_id}.json")
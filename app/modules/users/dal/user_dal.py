@@ -3,13 +3,15 @@
 import logging
 from contextlib import contextmanager
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func, or_
 
 from app.core.base_dal import BaseDAL
 from app.core.base_model import Pagination
 from app.enums.base_enums import Constants
+from app.exceptions.exception import ValidationException
+from app.middleware.translation_manager import _
 from app.modules.users.models.users import User
-from app.utils.filter_utils import apply_dynamic_filters
+from app.utils.filter_utils import apply_dynamic_filters, decode_cursor, encode_cursor
 
 
 class UserDAL(BaseDAL[User]):
@@ -66,6 +68,7 @@ class UserDAL(BaseDAL[User]):
 		logger.info(f'Searching users with parameters: {params}')
 		page = int(params.get('page', 1))
 		page_size = int(params.get('page_size', Constants.PAGE_SIZE))
+		cursor = params.get('cursor')
 
 		# Start with basic query
 		query = self.db.query(User).filter(User.is_deleted == 0)
@@ -73,18 +76,37 @@ class UserDAL(BaseDAL[User]):
 		# Apply dynamic filters using the common utility function
 		query = apply_dynamic_filters(query, User, params)
 
-		# Sort by creation date descending
-		query = query.order_by(User.create_date.desc())
-
-		# Count total records
-		total_count = query.count()
-
-		# Apply pagination
-		users = query.offset((page - 1) * page_size).limit(page_size).all()
+		# Sort by creation date descending, id breaks ties so the order is stable for cursors
+		query = query.order_by(User.create_date.desc(), User.id.desc())
+
+		if cursor:
+			# Keyset pagination: seek past the last row of the previous page instead of OFFSET.
+			# No COUNT here - one extra row is fetched to tell whether another page exists
+			try:
+				cursor_date, cursor_id = decode_cursor(cursor)
+			except ValueError:
+				raise ValidationException(message=_('invalid_cursor'))
+			query = query.filter(or_(User.create_date < cursor_date, and_(User.create_date == cursor_date, User.id < cursor_id)))
+			users = query.limit(page_size + 1).all()
+			has_next = len(users) > page_size
+			users = users[:page_size]
+			total_count = None
+		else:
+			# Count total records; counting ids without ORDER BY lets the planner use an index-only scan
+			count_subquery = query.order_by(None).with_entities(User.id).subquery()
+			total_count = self.db.query(func.count()).select_from(count_subquery).scalar()
+
+			# Apply pagination
+			users = query.offset((page - 1) * page_size).limit(page_size).all()
+			has_next = page * page_size < total_count
+
+		next_cursor = None
+		if has_next and users and users[-1].create_date:
+			next_cursor = encode_cursor(users[-1].create_date, users[-1].id)
 
 		logger.info(f'Found {total_count} users, returning page {page} with {len(users)} items')
 
-		return Pagination(items=users, total_count=total_count, page=page, page_size=page_size)
+		return Pagination(items=users, total_count=total_count, page=page, page_size=page_size, next_cursor=next_cursor)
 
 	@contextmanager
 	def transaction(self):
@@ -1,6 +1,8 @@
 import json
+from typing import List
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 
 from app.core.base_model import APIResponse, PagingInfo
 from app.enums.base_enums import BaseErrorCode
@@ -19,12 +21,16 @@ from app.modules.users.schemas.users import (
 
 route = APIRouter(prefix='/users', tags=['Users'], dependencies=[Depends(verify_token)])
 
+# Built once so a page of users is validated in a single call instead of per item
+_USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
 
 @route.get('/', response_model=APIResponse)
 @handle_exceptions
 async def search_users(
 	page: int = Query(1, ge=1),
 	page_size: int = Query(10, ge=1),
+	cursor: str | None = Query(None, description='Cursor from paging.next_cursor; takes precedence over page'),
 	filters_json: str | None = Query(None, description='JSON string of filters'),
 	current_user_payload: dict = Depends(get_current_user),
 	repo: UserRepo = Depends(),
@@ -64,18 +70,19 @@ async def search_users(
 		except Exception:
 			filters = []
 
-	request = SearchUserRequest(page=page, page_size=page_size, filters=filters)
+	request = SearchUserRequest(page=page, page_size=page_size, cursor=cursor, filters=filters)
 	result = repo.search_users(request)
 	return APIResponse(
 		error_code=BaseErrorCode.ERROR_CODE_SUCCESS,
 		message=_('operation_successful'),
 		data=PaginatedResponse[UserResponse](
-			items=[UserResponse.model_validate(user) for user in result.items],
+			items=_USER_LIST_ADAPTER.validate_python(result.items, from_attributes=True),
 			paging=PagingInfo(
 				total=result.total_count,
 				total_pages=result.total_pages,
 				page=result.page,
 				page_size=result.page_size,
+				next_cursor=result.next_cursor,
 			),
 		),
 	)
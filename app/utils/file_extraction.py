@@ -3,16 +3,27 @@ File content extraction utilities for different file formats.
 Supports PDF, DOCX, TXT and other text-based file formats.
 """
 
+import codecs
+import csv
 import io
 import logging
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 import tempfile
 import os
 
 import fitz
+from charset_normalizer import from_bytes
+
+try:
+	from docx import Document
+except ImportError:  # python-docx is optional; DOCX extraction reports it as missing
+	Document = None
 
 logger = logging.getLogger(__name__)
 
+# Encoding detection only needs a prefix of the file, not the whole payload
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
 
 class FileContentExtractor:
 	"""Utility class for extracting text content from various file formats"""
@@ -31,48 +42,40 @@ class FileContentExtractor:
 		    Tuple of (extracted_text, error_message)
 		"""
 		try:
-			# Normalize MIME type
-			file_type_lower = file_type.lower()
-
-			# Handle different file types
-			if file_type_lower == 'text/plain' or file_name.lower().endswith('.txt'):
-				return FileContentExtractor._extract_from_txt(file_content)
-
-			elif file_type_lower == 'application/pdf' or file_name.lower().endswith('.pdf'):
-				return FileContentExtractor._extract_from_pdf(file_content)
-
-			elif file_type_lower.startswith('application/vnd.openxmlformats-officedocument.wordprocessingml') or file_name.lower().endswith('.docx'):
-				return FileContentExtractor._extract_from_docx(file_content)
-
-			elif file_type_lower == 'application/msword' or file_name.lower().endswith('.doc'):
-				return FileContentExtractor._extract_from_doc(file_content)
-
-			elif file_type_lower == 'text/markdown' or file_name.lower().endswith(('.md', '.markdown')):
-				return FileContentExtractor._extract_from_txt(file_content)
-
-			elif file_type_lower == 'text/csv' or file_name.lower().endswith('.csv'):
-				return FileContentExtractor._extract_from_csv(file_content)
-
-			else:
+			handler = _resolve_handler(file_type, file_name)
+			if handler is None:
 				return None, f'Unsupported file type: {file_type}'
+			return handler(file_content)
 
 		except Exception as e:
 			logger.error(f'Error extracting content from {file_name}: {str(e)}')
 			return None, f'Extraction failed: {str(e)}'
 
+	@staticmethod
+	def _decode_text(file_content: bytes) -> str:
+		"""Decode text bytes in a single pass: BOM sniff, UTF-8, then charset detection on a sample"""
+		if file_content.startswith(codecs.BOM_UTF8):
+			return file_content.decode('utf-8-sig')
+		if file_content.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+			return file_content.decode('utf-32')
+		if file_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+			return file_content.decode('utf-16')
+
+		try:
+			return file_content.decode('utf-8')
+		except UnicodeDecodeError:
+			pass
+
+		best_match = from_bytes(file_content[:_ENCODING_SAMPLE_SIZE]).best()
+		encoding = best_match.encoding if best_match else 'latin-1'
+		return file_content.decode(encoding, errors='replace')
+
 	@staticmethod
 	def _extract_from_txt(file_content: bytes) -> Tuple[Optional[str], Optional[str]]:
 		"""Extract text from plain text files"""
 		try:
-			# Try different encodings
-			for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
-				try:
-					text = file_content.decode(encoding)
-					return text.strip(), None
-				except UnicodeDecodeError:
-					continue
-
-			return None, 'Could not decode text file with any supported encoding'
+			text = FileContentExtractor._decode_text(file_content)
+			return text.strip(), None
 
 		except Exception as e:
 			return None, f'Error reading text file: {str(e)}'
@@ -99,9 +102,10 @@ class FileContentExtractor:
 	@staticmethod
 	def _extract_from_docx(file_content: bytes) -> Tuple[Optional[str], Optional[str]]:
 		"""Extract text from DOCX files using python-docx"""
-		try:
-			from docx import Document
+		if Document is None:
+			return None, 'python-docx library not installed. Please install with: pip install python-docx'
 
+		try:
 			# Create a temporary file to work with python-docx
 			with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
 				temp_file.write(file_content)
@@ -109,20 +113,7 @@ class FileContentExtractor:
 
 				try:
 					doc = Document(temp_file.name)
-					text_content = []
-
-					for paragraph in doc.paragraphs:
-						if paragraph.text.strip():
-							text_content.append(paragraph.text)
-
-					# Also extract text from tables
-					for table in doc.tables:
-						for row in table.rows:
-							for cell in row.cells:
-								if cell.text.strip():
-									text_content.append(cell.text)
-
-					full_text = '\n'.join(text_content).strip()
+					full_text = '\n'.join(FileContentExtractor._iter_docx_text(doc)).strip()
 					return full_text if full_text else None, None
 
 				finally:
@@ -132,11 +123,25 @@ class FileContentExtractor:
 					except:
 						pass
 
-		except ImportError:
-			return None, 'python-docx library not installed. Please install with: pip install python-docx'
 		except Exception as e:
 			return None, f'Error reading DOCX file: {str(e)}'
 
+	@staticmethod
+	def _iter_docx_text(doc) -> Iterator[str]:
+		"""Yield non-blank paragraph and table cell texts, reading each python-docx text property once"""
+		for paragraph in doc.paragraphs:
+			text = paragraph.text
+			if text and not text.isspace():
+				yield text
+
+		# Also extract text from tables
+		for table in doc.tables:
+			for row in table.rows:
+				for cell in row.cells:
+					text = cell.text
+					if text and not text.isspace():
+						yield text
+
 	@staticmethod
 	def _extract_from_doc(file_content: bytes) -> Tuple[Optional[str], Optional[str]]:
 		"""Extract text from legacy DOC files"""
@@ -152,28 +157,18 @@ class FileContentExtractor:
 	def _extract_from_csv(file_content: bytes) -> Tuple[Optional[str], Optional[str]]:
 		"""Extract text from CSV files"""
 		try:
-			import csv
-
-			# Try different encodings
-			for encoding in ['utf-8', 'utf-16', 'latin-1', 'cp1252']:
-				try:
-					text_content = file_content.decode(encoding)
+			text_content = FileContentExtractor._decode_text(file_content)
 
-					# Parse CSV and convert to readable text
-					csv_reader = csv.reader(io.StringIO(text_content))
-					rows = []
+			# Parse CSV and convert to readable text
+			csv_reader = csv.reader(io.StringIO(text_content))
+			rows = []
 
-					for row in csv_reader:
-						if row:  # Skip empty rows
-							rows.append(' | '.join(row))
+			for row in csv_reader:
+				if row:  # Skip empty rows
+					rows.append(' | '.join(row))
 
-					full_text = '\n'.join(rows).strip()
-					return full_text if full_text else None, None
-
-				except UnicodeDecodeError:
-					continue
-
-			return None, 'Could not decode CSV file with any supported encoding'
+			full_text = '\n'.join(rows).strip()
+			return full_text if full_text else None, None
 
 		except Exception as e:
 			return None, f'Error reading CSV file: {str(e)}'
@@ -181,21 +176,36 @@ class FileContentExtractor:
 	@staticmethod
 	def is_supported_file_type(file_type: str, file_name: str) -> bool:
 		"""Check if a file type is supported for text extraction"""
-		file_type_lower = file_type.lower()
-		file_name_lower = file_name.lower()
-
-		supported_types = ['text/plain', 'application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml', 'application/msword', 'text/markdown', 'text/csv']
-
-		supported_extensions = ['.txt', '.pdf', '.docx', '.doc', '.md', '.markdown', '.csv']
-
-		# Check MIME type
-		for supported_type in supported_types:
-			if file_type_lower.startswith(supported_type):
-				return True
-
-		# Check file extension as fallback
-		for ext in supported_extensions:
-			if file_name_lower.endswith(ext):
-				return True
-
-		return False
+		return _resolve_handler(file_type, file_name) is not None
+
+
+# Dispatch tables built once at import: MIME type (without parameters) first, then file extension
+_HANDLERS_BY_MIME = {
+	'text/plain': FileContentExtractor._extract_from_txt,
+	'application/pdf': FileContentExtractor._extract_from_pdf,
+	'application/vnd.openxmlformats-officedocument.wordprocessingml': FileContentExtractor._extract_from_docx,
+	'application/vnd.openxmlformats-officedocument.wordprocessingml.document': FileContentExtractor._extract_from_docx,
+	'application/vnd.openxmlformats-officedocument.wordprocessingml.template': FileContentExtractor._extract_from_docx,
+	'application/msword': FileContentExtractor._extract_from_doc,
+	'text/markdown': FileContentExtractor._extract_from_txt,
+	'text/csv': FileContentExtractor._extract_from_csv,
+}
+
+_HANDLERS_BY_EXTENSION = {
+	'.txt': FileContentExtractor._extract_from_txt,
+	'.pdf': FileContentExtractor._extract_from_pdf,
+	'.docx': FileContentExtractor._extract_from_docx,
+	'.doc': FileContentExtractor._extract_from_doc,
+	'.md': FileContentExtractor._extract_from_txt,
+	'.markdown': FileContentExtractor._extract_from_txt,
+	'.csv': FileContentExtractor._extract_from_csv,
+}
+
+
+def _resolve_handler(file_type: str | None, file_name: str | None):
+	"""Return the extractor for a MIME type / filename pair, or None if unsupported"""
+	mime = (file_type or '').split(';', 1)[0].strip().lower()
+	handler = _HANDLERS_BY_MIME.get(mime)
+	if handler is None:
+		handler = _HANDLERS_BY_EXTENSION.get(os.path.splitext(file_name or '')[1].lower())
+	return handler
@@ -9,8 +9,10 @@ Last Modified: 21 Apr 2025
 Version: 1.0.0
 """
 
+import base64
 import logging
-from typing import Any, TypeVar
+from datetime import datetime
+from typing import Any, Tuple, TypeVar
 
 from sqlalchemy import Column, String, cast
 from sqlalchemy.orm.query import Query
@@ -117,7 +119,7 @@ def apply_dynamic_filters(query: Query, model: Any, params: dict) -> Query:
 	# Process legacy direct filters (for backward compatibility)
 	for key, value in params.items():
 		# Skip pagination parameters and filters list
-		if key in ['page', 'page_size', 'filters']:
+		if key in ['page', 'page_size', 'cursor', 'filters']:
 			continue
 
 		# Check if the key exists as a column in model
@@ -138,3 +140,36 @@ def apply_dynamic_filters(query: Query, model: Any, params: dict) -> Query:
 					logger.debug(f'Applied exact match filter on {key}: {value}')
 
 	return query
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+	"""
+	Encodes the last row of a page into an opaque keyset pagination cursor.
+
+	Args:
+	    sort_value (datetime): Value of the sort column on the last row
+	    row_id (str): Primary key of the last row, used as tie-breaker
+
+	Returns:
+	    str: URL-safe cursor string
+	"""
+	raw = f'{sort_value.isoformat()}|{row_id}'
+	return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+	"""
+	Decodes a cursor produced by encode_cursor.
+
+	Args:
+	    cursor (str): Cursor string received from the client
+
+	Returns:
+	    Tuple[datetime, str]: (sort_value, row_id) of the last row of the previous page
+
+	Raises:
+	    ValueError: If the cursor is malformed
+	"""
+	raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+	sort_value, row_id = raw.split('|', 1)
+	return datetime.fromisoformat(sort_value), row_id
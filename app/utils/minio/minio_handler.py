@@ -7,9 +7,13 @@ import io
 import logging
 import os
 import uuid
+from datetime import timedelta
 from typing import Tuple
 
+import certifi
+import urllib3
 from fastapi import UploadFile
+from urllib3.util.retry import Retry
 
 from app.core.config import get_settings
 from minio import Minio
@@ -26,6 +30,18 @@ if isinstance(secure_value, str):
 
 logger.info(f'MinIO config: endpoint={settings.MINIO_ENDPOINT}, access_key={settings.MINIO_ACCESS_KEY}, bucket_name={settings.MINIO_BUCKET_NAME}, secure={secure_value}')
 
+# One shared connection pool for all MinIO calls; the client default (maxsize=10) is too small for concurrent requests
+http_client = urllib3.PoolManager(
+	num_pools=10,
+	maxsize=settings.MINIO_POOL_MAXSIZE,
+	block=False,
+	# Timeout, TLS and retry settings match the MinIO client's own default pool
+	timeout=timedelta(minutes=5).seconds,
+	cert_reqs='CERT_REQUIRED',
+	ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+	retries=Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+
 
 class MinioHandler:
 	"""
@@ -47,6 +63,7 @@ class MinioHandler:
 			access_key=settings.MINIO_ACCESS_KEY,
 			secret_key=settings.MINIO_SECRET_KEY,
 			secure=secure_param,  # Use the parsed boolean value
+			http_client=http_client,
 		)
 		self.bucket_name = settings.MINIO_BUCKET_NAME
 		# self._ensure_bucket_exists()
@@ -150,21 +167,29 @@ class MinioHandler:
 		    The object name (path) in MinIO storage
 		"""
 		try:
-			# Read file content
-			file_content = await file.read()
+			# Generate a safe object name with UUID, meeting_id and file_type
+			object_name = self._generate_safe_object_name(meeting_id, file.filename, file_type)
+			logger.info(f"Streaming upload of '{file.filename}' as '{object_name}', size: {file.size} bytes")
 
-			# Reset file cursor
+			# Hand the spooled file straight to MinIO instead of reading it into memory;
+			# an unknown size falls back to a multipart upload with 5 MiB parts
+			length = file.size if file.size is not None else -1
 			await file.seek(0)
-
-			# Use the upload_file method
-			return await self.upload_file(
-				file_content=file_content,
-				file_name=file.filename,
-				meeting_id=meeting_id,
+			self.minio_client.put_object(
+				bucket_name=self.bucket_name,
+				object_name=object_name,
+				data=file.file,
+				length=length,
 				content_type=file.content_type or 'application/octet-stream',
-				file_type=file_type,
+				part_size=0 if length >= 0 else 5 * 1024 * 1024,
 			)
 
+			# Reset file cursor for callers that read the upload afterwards
+			await file.seek(0)
+
+			logger.info(f"File '{file.filename}' uploaded successfully to MinIO as '{object_name}'")
+			return object_name
+
 		except Exception as err:
 			logger.error(f'Error uploading FastAPI file to MinIO: {err}')
 			raise
@@ -238,16 +263,16 @@ class MinioHandler:
 			# Get file from MinIO
 			response = self.minio_client.get_object(bucket_name=self.bucket_name, object_name=object_name)
 
-			# Read all data
-			file_content = response.read()
+			# Read all data, always returning the connection to the pool
+			try:
+				file_content = response.read()
+			finally:
+				response.close()
+				response.release_conn()
 
 			# Get just the filename from the object path
 			file_name = os.path.basename(object_name)
 
-			# Close the response
-			response.close()
-			response.release_conn()
-
 			logger.info(f"File '{object_name}' downloaded successfully from MinIO")
 			return file_content, file_name
 
@@ -270,8 +295,6 @@ class MinioHandler:
 		    A presigned URL for the file
 		"""
 		try:
-			from datetime import timedelta
-
 			expires_delta = timedelta(seconds=expires) if expires else timedelta(days=7)
 
 			url = self.minio_client.presigned_get_object(
@@ -327,12 +350,12 @@ class MinioHandler:
 			# Get file from MinIO
 			response = self.minio_client.get_object(bucket_name=self.bucket_name, object_name=object_name)
 
-			# Read all data
-			file_content = response.read()
-
-			# Close the response
-			response.close()
-			response.release_conn()
+			# Read all data, always returning the connection to the pool
+			try:
+				file_content = response.read()
+			finally:
+				response.close()
+				response.release_conn()
 
 			logger.info(f'File content retrieved successfully: {len(file_content)} bytes')
 			return file_content
@@ -1,6 +1,11 @@
+import io
+import logging
 import os
+
 import fitz
 
+logger = logging.getLogger(__name__)
+
 
 class MDToPDFConverter:
 	def __init__(self, markdown_text: str, css_path: str | None = None):
@@ -146,8 +151,6 @@ class MDToPDFConverter:
 		"""
 		Convert the markdown text to a styled PDF file using WeasyPrint.
 		"""
-		import io
-
 		import markdown2
 		from weasyprint import CSS, HTML
 
@@ -189,9 +192,7 @@ class PDFToTextConverter:
 		    dict: A dictionary containing the extracted text in different formats.
 		"""
 		try:
-			print('[DEBUG] Starting PDF text extraction in multiple formats')
-			print(f'[DEBUG] Processing PDF file: {self.file_path}')
-			print(f'[DEBUG] Document has {len(self.doc)} pages')
+			logger.debug('Extracting text from %s (%d pages)', self.file_path, len(self.doc))
 
 			result = {}
 
@@ -199,9 +200,7 @@ class PDFToTextConverter:
 			result['text'] = '\n'.join([page.get_text('text') for page in self.doc])
 			return result
 		except Exception as e:
-			print(f'[DEBUG] Error extracting text from PDF: {str(e)}')
-			print(f'[DEBUG] Exception type: {type(e).__name__}')
-			print(f'[DEBUG] Exception occurred in file: {self.file_path}')
+			logger.error(f'Error extracting text from PDF {self.file_path}: {type(e).__name__}: {e}')
 			return {}  # Return empty dict or raise a custom exception
 
 	@staticmethod
@@ -224,8 +223,6 @@ class PDFToTextConverter:
 				doc = fitz.open(stream=file_content, filetype=filetype)
 			else:
 				# It's bytes, convert to BytesIO
-				import io
-
 				file_stream = io.BytesIO(file_content)
 				doc = fitz.open(stream=file_stream, filetype=filetype)
 
@@ -241,7 +238,7 @@ class PDFToTextConverter:
 
 			return results
 		except Exception as e:
-			print(f'[DEBUG] Error extracting text from PDF: {str(e)}')
+			logger.error(f'Error extracting text from PDF: {e}')
 			return {'text': ''}  # Return empty text instead of empty dict
 
 	def search_for_text(self, search_string: str) -> list:
@@ -255,3 +252,17 @@ class PDFToTextConverter:
 
 	def close(self):
 		self.doc.close()
+
+
+def extract_pdf_text(file_path: str) -> dict:
+	"""
+	Open a PDF, extract its text and close it again.
+
+	Kept at module level so it can be pickled and run in a process pool,
+	away from the event loop.
+	"""
+	converter = PDFToTextConverter(file_path=file_path)
+	try:
+		return converter.extract_text()
+	finally:
+		converter.close()
@@ -13,11 +13,21 @@ from app.core.config import get_settings
 class RedisClient:
 	"""Redis client for caching operations"""
 
-	def __init__(self):
+	def __init__(self, url: Optional[str] = None, timeout: Optional[float] = None):
+		"""
+		Args:
+		    url: Redis URL; defaults to the shared cache instance
+		    timeout: Socket connect and read timeout in seconds (None waits indefinitely)
+		"""
 		self.settings = get_settings()
 		# Extract Redis URL from Celery broker URL for consistency
 		redis_url = self.settings.CELERY_BROKER_URL.replace('/0', '/1')  # Use DB 1 for cache
-		self.redis_client = redis.from_url('redis://160.191.88.194:6379/1', decode_responses=True)
+		self.redis_client = redis.from_url(
+			url or 'redis://160.191.88.194:6379/1',
+			decode_responses=True,
+			socket_connect_timeout=timeout,
+			socket_timeout=timeout,
+		)
 
 	async def get(self, key: str) -> Optional[Any]:
 		"""
@@ -0,0 +1,60 @@
+"""Tests for the user list endpoint serialization"""
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.base_model import Pagination
+from app.enums.user_enums import UserRoleEnum
+from app.http.oauth2 import get_current_user
+from app.middleware.auth_middleware import verify_token
+from app.modules.users.models.users import User
+from app.modules.users.repository.user_repo import UserRepo
+from app.modules.users.routes.v1.user_routes import route
+from app.modules.users.schemas.users import UserResponse
+
+
+def _make_user() -> User:
+	try:
+		return User(
+			id='3f1c2a9e-0000-4000-8000-000000000001',
+			email='jane@example.com',
+			username='jane',
+			name='Jane Doe',
+			first_name='Jane',
+			last_name='Doe',
+			locale='vi',
+			role=UserRoleEnum.ADMIN,
+			confirmed=True,
+			create_date=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+		)
+	except SQLAlchemyError as ex:
+		pytest.skip(f'User mapper cannot be configured in this tree: {ex}')
+
+
+class _StubUserRepo:
+	def __init__(self, rows):
+		self.rows = rows
+
+	def search_users(self, request):
+		return Pagination(items=self.rows, total_count=len(self.rows), page=request.page, page_size=request.page_size)
+
+
+def test_search_users_matches_model_validate():
+	user = _make_user()
+
+	app = FastAPI()
+	app.include_router(route)
+	app.dependency_overrides[verify_token] = lambda: None
+	app.dependency_overrides[get_current_user] = lambda: {'user_id': user.id}
+	app.dependency_overrides[UserRepo] = lambda: _StubUserRepo([user])
+
+	response = TestClient(app).get('/users/')
+
+	assert response.status_code == 200
+	body = response.json()
+	assert body['data']['items'] == [UserResponse.model_validate(user).model_dump(mode='json')]
+	assert body['data']['items'][0]['role'] == 'admin'